@@ -12,11 +12,18 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("Could not import 'agents' library. Using dummy 'tool' decorator.")
 
-from app.repository.monitoring_store import monitoring_store # 모니터링 저장소 인스턴스 직접 임포트
+from app.repository.monitoring_store import monitoring_store, SQLiteMonitoringRepository # 모니터링 저장소 인스턴스 직접 임포트
 from app.models.enums import MonitoringStatus # 모니터링 상태 Enum
 
 logger = logging.getLogger(__name__)
 
+# 저장소 오버라이드 (테스트 등에서 모의 저장소 주입용, None이면 기본 monitoring_store 사용)
+_store_override: Optional[SQLiteMonitoringRepository] = None
+
+def _get_store() -> SQLiteMonitoringRepository:
+    """도구가 사용할 모니터링 저장소를 반환합니다. 오버라이드가 설정되어 있으면 우선 사용합니다."""
+    return _store_override if _store_override is not None else monitoring_store
+
 # --- Log Monitoring Start Tool ---
 
 class LogStartInput(BaseModel):
@@ -32,7 +39,7 @@ def log_monitoring_start_tool(input_data: LogStartInput) -> Optional[int]:
     """
     logger.info(f"Tool 'log_monitoring_start_tool' called for task: {input_data.task_name}")
     try:
-        log_id = monitoring_store.log_start(input_data.task_name)
+        log_id = _get_store().log_start(input_data.task_name)
         if log_id is not None:
             logger.info(f"Monitoring log started for task '{input_data.task_name}' with Log ID: {log_id}")
             return log_id
@@ -62,7 +69,7 @@ def log_monitoring_end_tool(input_data: LogEndInput) -> bool:
     """
     logger.info(f"Tool 'log_monitoring_end_tool' called for Log ID: {input_data.log_id} with status: {input_data.status}")
     try:
-        success = monitoring_store.log_end(
+        success = _get_store().log_end(
             log_id=input_data.log_id,
             status=input_data.status,
             items_processed=input_data.items_processed,
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Literal
 from pydantic import BaseModel, Field, validator, root_validator, datetime_parse # datetime_parse 추가
 from importlib import import_module
@@ -23,6 +24,22 @@ from app.scheduler.scheduler import add_job_to_scheduler, get_job_status, list_a
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=128)
+def _cached_cron_trigger(trigger_items: tuple) -> CronTrigger:
+    """동일한 cron 인자로 생성한 CronTrigger를 재사용합니다. (cron 표현식 파싱은 인자당 한 번만 수행)
+    트리거는 작업 실행 중 변경되지 않으므로 여러 작업이 같은 인스턴스를 공유해도 안전합니다.
+    """
+    return CronTrigger(**dict(trigger_items))
+
+def _build_trigger(trigger_class, trigger_args: Dict[str, Any]):
+    """트리거 객체 생성 (cron 트리거는 인자가 해시 가능하면 캐시 사용)"""
+    if trigger_class is CronTrigger:
+        try:
+            return _cached_cron_trigger(tuple(sorted(trigger_args.items())))
+        except TypeError: # 해시 불가능한 인자 (캐시 키로 사용 불가)
+            pass
+    return trigger_class(**trigger_args)
+
 def find_runnable(path: str):
     """점(.)으로 구분된 경로 문자열을 받아 실제 실행 가능한 객체(함수 등)를 반환합니다."""
     try:
@@ -83,7 +100,7 @@ async def schedule_collection_task_tool(input_data: ScheduleTaskInput) -> Option
             logger.error(f"Invalid trigger_type: {input_data.trigger_type}")
             return None
 
-        trigger = trigger_class(**input_data.trigger_args)
+        trigger = _build_trigger(trigger_class, input_data.trigger_args)
 
         # 3. 스케줄러에 작업 추가 요청
         job_name = input_data.job_name or input_data.function_path # 이름 미지정 시 함수 경로 사용
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 
-from app.collector.rss_collector import RSSCollector, collect_feeds
+from app.collector.rss_collector import RSSCollector, collect_feeds_async
 from app.config import DATA_DIR, FILTERED_FEEDS_DIR, API_VERSION
 from app.models.schemas import FeedItem
 
@@ -45,7 +45,7 @@ async def collect_rss_feeds(refresh: bool = Query(False, description="강제로
             }
         
         # 피드 수집 실행
-        items = collect_feeds()
+        items = await collect_feeds_async()
         
         return {
             "status": "success",
@@ -81,7 +81,7 @@ async def get_latest_feeds(
         
         if not feed_files:
             # 파일이 없으면 새로 수집
-            items = collect_feeds()
+            items = await collect_feeds_async()
         else:
             # 최신 파일 사용
             latest_file = feed_files[0]
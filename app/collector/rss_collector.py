@@ -1,19 +1,24 @@
-import json
+import asyncio
 import logging
 import os
 import re
-import time
+import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import aiohttp
 import feedparser
 import requests
 from bs4 import BeautifulSoup
-from pydantic import ValidationError
+from lxml import etree
+from pydantic import TypeAdapter, ValidationError
 
-from app.config import DATA_DIR, RSS_SOURCES
+from app.config import DATA_DIR, RSS_SOURCES, USER_AGENT
 from app.models.schemas import FeedItem, FeedSource
 
 # 로깅 설정
@@ -27,20 +32,67 @@ logger = logging.getLogger(__name__)
 RAW_FEEDS_DIR = DATA_DIR / "raw_feeds"
 os.makedirs(RAW_FEEDS_DIR, exist_ok=True)
 
+# _clean_html 정규식 (호출마다 re 캐시를 조회하지 않도록 모듈 로드 시 한 번만 컴파일)
+# 태그/script/style/CDATA 처리는 BeautifulSoup에 맡기고, 추출된 텍스트의 공백 압축과 구두점 앞 공백 제거만 한 번의 sub로 처리
+_WHITESPACE_RE = re.compile(r'\s+')
+_CLOSING_PUNCT = frozenset('.,!?')
+
+
+def _replace_whitespace(match: re.Match) -> str:
+    """공백 구간을 공백 하나로 바꾸되, 바로 뒤가 구두점이면 제거"""
+    next_char = match.string[match.end():match.end() + 1]
+    return '' if next_char in _CLOSING_PUNCT else ' '
+
+# 스트리밍 파싱 중 받은 본문을 메모리에 두는 최대 크기 (초과분은 임시 파일로 넘김)
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+# FeedItem 목록 검증/직렬화기 (pydantic-core가 목록 전체를 한 번에 처리)
+_FEED_LIST_ADAPTER = TypeAdapter(List[FeedItem])
+
+_FEED_SOURCE_LIST_ADAPTER = TypeAdapter(List[FeedSource])
+
+
+@lru_cache(maxsize=None)
+def _default_feed_sources() -> List[Dict]:
+    """
+    기본 피드 소스(config.py의 RSS_SOURCES)를 FeedSource 스키마로 검증해 반환
+    
+    검증은 기본 소스를 처음 사용할 때 한 번만 수행합니다 (성공한 결과만 캐시).
+    수집 코드는 dict 형태를 그대로 사용하므로 검증 결과 대신 원본 목록을 반환합니다.
+    
+    Raises:
+        ValidationError: RSS_SOURCES 설정이 FeedSource 스키마와 맞지 않는 경우 (오류 로그 기록 후 다시 발생)
+    """
+    try:
+        _FEED_SOURCE_LIST_ADAPTER.validate_python(RSS_SOURCES)
+    except ValidationError as e:
+        logger.error(f"RSS_SOURCES 설정 오류 (app/config.py): {str(e)}")
+        raise
+    return RSS_SOURCES
+
 
 class RSSCollector:
     """RSS 피드 수집 클래스"""
     
-    def __init__(self, feed_sources: Optional[List[Dict]] = None, timeout: int = 30):
+    # 인스턴스 속성을 __dict__ 대신 슬롯에 저장 (피드 항목 처리 루프의 속성 접근 비용 절감)
+    __slots__ = ('feed_sources', 'timeout', 'max_workers', 'stream_parse')
+    
+    def __init__(self, feed_sources: Optional[List[Dict]] = None, timeout: int = 30, max_workers: Optional[int] = None,
+                 stream_parse: bool = False):
         """
         RSS 피드 수집기 초기화
         
         Args:
             feed_sources: RSS 피드 소스 목록. 지정하지 않으면 config.py의 RSS_SOURCES 사용
             timeout: RSS 피드 요청 타임아웃 (초)
+            max_workers: 피드 동시 수집 스레드 수. 지정하지 않으면 min(32, 피드 소스 수)
+            stream_parse: True이면 RSS 2.0 피드를 lxml로 스트리밍 파싱 (대용량 피드의 메모리 사용량 절감).
+                동기 경로(fetch_all_feeds/fetch_feed) 전용이며, fetch_all_feeds_async는 이 옵션과 관계없이 본문 전체를 feedparser로 파싱
         """
-        self.feed_sources = feed_sources or RSS_SOURCES
+        self.feed_sources = feed_sources or _default_feed_sources()
         self.timeout = timeout
+        self.max_workers = max_workers or min(32, max(1, len(self.feed_sources)))
+        self.stream_parse = stream_parse
         logger.info(f"RSSCollector 초기화: {len(self.feed_sources)} 개의 피드 소스 로드")
     
     def fetch_all_feeds(self) -> List[FeedItem]:
@@ -52,14 +104,47 @@ class RSSCollector:
         """
         all_items = []
         
-        for source in self.feed_sources:
-            try:
-                items = self.fetch_feed(source)
+        # 피드 요청은 대부분 네트워크 대기 시간이므로 스레드 풀로 동시에 수집
+        # (executor.map은 결과를 피드 소스 순서대로 반환하므로 중복 제거 시 우선순위가 유지됨)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for items in executor.map(self._fetch_source, self.feed_sources):
                 all_items.extend(items)
-                logger.info(f"피드 수집 완료: {source['name']}, {len(items)}개 항목 발견")
-            except Exception as e:
-                logger.error(f"피드 수집 실패: {source['name']} - {str(e)}")
         
+        return self._finalize_items(all_items)
+    
+    async def fetch_all_feeds_async(self) -> List[FeedItem]:
+        """
+        모든 RSS 피드 소스에서 기사를 비동기로 수집 (이벤트 루프 안에서 호출할 때 사용)
+        
+        aiohttp 세션 하나로 모든 피드를 동시에 요청하고, CPU 작업인 피드 파싱/변환과
+        결과 파일 저장은 기본 스레드 풀에서 수행해 이벤트 루프를 막지 않습니다.
+        stream_parse 옵션은 적용되지 않습니다(동기 경로 전용).
+        
+        Returns:
+            수집된 피드 아이템 목록
+        """
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(timeout=timeout, headers={'User-Agent': USER_AGENT}) as session:
+            # gather는 결과를 피드 소스 순서대로 반환하므로 중복 제거 시 우선순위가 유지됨
+            results = await asyncio.gather(
+                *(self._fetch_source_async(session, source) for source in self.feed_sources)
+            )
+        
+        all_items = [item for items in results for item in items]
+        # 중복 제거 후 JSON 파일 쓰기(_save_feeds)는 동기 I/O이므로 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._finalize_items, all_items)
+    
+    def _finalize_items(self, all_items: List[FeedItem]) -> List[FeedItem]:
+        """
+        수집된 전체 항목의 중복을 제거하고 저장
+        
+        Args:
+            all_items: 모든 피드 소스에서 수집한 피드 아이템 목록
+            
+        Returns:
+            중복이 제거된 피드 아이템 목록
+        """
         # 중복 제거
         unique_items = self._remove_duplicates(all_items)
         
@@ -69,6 +154,58 @@ class RSSCollector:
         logger.info(f"총 {len(all_items)}개 항목 수집, 중복 제거 후 {len(unique_items)}개 남음")
         return unique_items
     
+    def _fetch_source(self, source: Dict) -> List[FeedItem]:
+        """
+        fetch_all_feeds의 작업 단위: 단일 피드 소스를 수집하고 결과를 로깅
+        
+        Args:
+            source: RSS 피드 소스 정보
+            
+        Returns:
+            수집된 피드 아이템 목록 (실패 시 빈 목록)
+        """
+        try:
+            items = self.fetch_feed(source)
+            logger.info(f"피드 수집 완료: {source['name']}, {len(items)}개 항목 발견")
+            return items
+        except Exception as e:
+            logger.error(f"피드 수집 실패: {source['name']} - {str(e)}")
+            return []
+    
+    async def _fetch_source_async(self, session: aiohttp.ClientSession, source: Dict) -> List[FeedItem]:
+        """
+        fetch_all_feeds_async의 작업 단위: 단일 피드 소스를 비동기로 요청하고 스레드 풀에서 파싱
+        
+        Args:
+            session: 공유 aiohttp 세션
+            source: RSS 피드 소스 정보
+            
+        Returns:
+            수집된 피드 아이템 목록 (실패 시 빈 목록)
+        """
+        try:
+            async with session.get(source['url']) as response:
+                response.raise_for_status()
+                body = await response.read()
+                # feedparser.parse(url)처럼 응답 헤더(문자셋, content-location 등)를 파싱에 전달 (키는 소문자로 정규화)
+                response_headers = {key.lower(): value for key, value in response.headers.items()}
+                response_headers.setdefault('content-location', str(response.url))
+            
+            loop = asyncio.get_running_loop()
+            items = await loop.run_in_executor(None, self._items_from_body, body, source, response_headers)
+            logger.info(f"피드 수집 완료: {source['name']}, {len(items)}개 항목 발견")
+            return items
+        except Exception as e:
+            logger.error(f"피드 수집 실패: {source['name']} - {str(e)}")
+            return []
+    
+    def _items_from_body(self, body: bytes, source: Dict, response_headers: Optional[Dict[str, str]] = None) -> List[FeedItem]:
+        """내려받은 피드 본문을 응답 헤더와 함께 feedparser로 파싱해 FeedItem 목록으로 변환
+        
+        헤더의 Content-Type 문자셋과 Content-Location(상대 링크 기준 URL)은 문서 내부 추정보다 우선합니다.
+        """
+        return self._items_from_feed(feedparser.parse(body, response_headers=response_headers), source)
+    
     def fetch_feed(self, source: Dict) -> List[FeedItem]:
         """
         특정 RSS 피드 소스에서 기사를 수집
@@ -80,52 +217,173 @@ class RSSCollector:
             수집된 피드 아이템 목록
         """
         try:
-            feed = feedparser.parse(source['url'])
+            if self.stream_parse:
+                feed = self._parse_with_lxml(source['url'])
+            else:
+                feed = feedparser.parse(source['url'])
             
-            if feed.bozo == 1 and not feed.entries:
-                logger.warning(f"피드 파싱 오류: {source['url']} - {feed.bozo_exception}")
-                return []
-            
-            items = []
-            for entry in feed.entries:
-                try:
-                    # 게시 날짜 파싱
-                    published = self._parse_date(entry)
-                    
-                    # 콘텐츠 추출
-                    content = self._extract_content(entry)
-                    
-                    # 태그 추출
-                    tags = self._extract_tags(entry)
-                    
-                    # 아이템 ID 생성
-                    item_id = str(uuid.uuid5(uuid.NAMESPACE_URL, entry.link))
-                    
-                    # FeedItem 객체 생성
-                    item = FeedItem(
-                        id=item_id,
-                        title=entry.title,
-                        description=entry.get('summary', ''),
-                        content=content,
-                        link=entry.link,
-                        published=published,
-                        updated=published,  # 대부분의 피드는 updated를 제공하지 않음
-                        source_name=source['name'],
-                        source_url=source['url'],
-                        source_category=source['category'],
-                        tags=tags
-                    )
-                    
-                    items.append(item)
-                except (ValidationError, KeyError, AttributeError) as e:
-                    logger.warning(f"피드 항목 파싱 오류: {source['name']} - {str(e)}")
-                    continue
-            
-            return items
+            return self._items_from_feed(feed, source)
         except Exception as e:
             logger.error(f"피드 요청 오류: {source['url']} - {str(e)}")
             return []
     
+    def _items_from_feed(self, feed: feedparser.FeedParserDict, source: Dict) -> List[FeedItem]:
+        """
+        파싱된 피드의 엔트리를 FeedItem 목록으로 변환
+        
+        Args:
+            feed: feedparser 파싱 결과
+            source: RSS 피드 소스 정보
+            
+        Returns:
+            변환된 피드 아이템 목록 (파싱 오류로 엔트리가 없으면 빈 목록)
+        """
+        if feed.bozo == 1 and not feed.entries:
+            logger.warning(f"피드 파싱 오류: {source['url']} - {feed.bozo_exception}")
+            return []
+        
+        raw_items = []
+        for entry in feed.entries:
+            try:
+                # 게시 날짜 파싱
+                published = self._parse_date(entry)
+                
+                # 콘텐츠 추출
+                content = self._extract_content(entry)
+                
+                # 태그 추출
+                tags = self._extract_tags(entry)
+                
+                # 아이템 ID 생성
+                item_id = str(uuid.uuid5(uuid.NAMESPACE_URL, entry.link))
+                
+                # FeedItem 필드 dict 생성 (검증은 아래에서 목록 단위로 한 번에 수행)
+                raw_items.append(dict(
+                    id=item_id,
+                    title=entry.title,
+                    description=entry.get('summary', ''),
+                    content=content,
+                    link=entry.link,
+                    published=published,
+                    updated=published,  # 대부분의 피드는 updated를 제공하지 않음
+                    source_name=source['name'],
+                    source_url=source['url'],
+                    source_category=source['category'],
+                    tags=tags
+                ))
+            except (KeyError, AttributeError) as e:
+                logger.warning(f"피드 항목 파싱 오류: {source['name']} - {str(e)}")
+                continue
+        
+        return self._validate_items(raw_items, source['name'])
+    
+    def _validate_items(self, raw_items: List[Dict], source_name: str) -> List[FeedItem]:
+        """
+        피드 항목 dict 목록을 FeedItem 목록으로 검증
+        
+        목록 전체를 TypeAdapter로 한 번에 검증하고, 잘못된 항목이 있으면 항목별로 다시 검증해
+        해당 항목만 경고 로그와 함께 제외합니다.
+        
+        Args:
+            raw_items: FeedItem 필드 dict 목록
+            source_name: 로그에 표시할 피드 소스 이름
+            
+        Returns:
+            검증된 피드 아이템 목록
+        """
+        try:
+            return _FEED_LIST_ADAPTER.validate_python(raw_items)
+        except ValidationError:
+            pass
+        
+        items = []
+        for raw_item in raw_items:
+            try:
+                items.append(FeedItem(**raw_item))
+            except ValidationError as e:
+                logger.warning(f"피드 항목 파싱 오류: {source_name} - {str(e)}")
+        return items
+    
+    def _parse_with_lxml(self, url: str) -> feedparser.FeedParserDict:
+        """
+        RSS 2.0 피드를 내려받으면서 lxml로 item 단위 스트리밍 파싱
+        
+        item 요소는 변환 직후 해제하므로 파싱 트리가 피드 전체가 아닌 항목 하나 크기에 비례합니다.
+        받은 본문은 대체 파싱용으로 SpooledTemporaryFile에 기록하며, 일정 크기를 넘으면 디스크로 넘어가
+        메모리에 피드 전체가 쌓이지 않습니다.
+        item을 찾지 못했거나(Atom 등) XML이 올바르지 않으면 기록해 둔 본문을 응답 헤더와 함께
+        feedparser로 다시 파싱합니다 (같은 피드를 다시 요청하지 않음).
+        
+        feedparser 경로와 달리 상대 링크를 피드 URL 기준 절대 URL로 바꾸지 않고,
+        guid/id 정규화도 하지 않습니다 (link/title/description 등 요소 텍스트를 그대로 사용).
+        
+        Args:
+            url: RSS 피드 URL
+            
+        Returns:
+            feedparser 결과와 같은 형태의 FeedParserDict
+        """
+        parser = etree.XMLPullParser(events=('end',), tag='{*}item')
+        entries = []
+        # feedparser 대체 파싱용 원본 본문 (작은 피드는 메모리, 큰 피드는 임시 파일)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+            with requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                response_headers = {key.lower(): value for key, value in response.headers.items()}
+                response_headers.setdefault('content-location', str(response.url))
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    spool.write(chunk)
+                    if parser is None: # 스트리밍 파싱 실패 후에는 본문만 끝까지 수신
+                        continue
+                    try:
+                        parser.feed(chunk)
+                        for _, elem in parser.read_events():
+                            entries.append(self._lxml_item_to_entry(elem))
+                            # 처리한 item과 앞선 형제 노드를 해제해 트리가 커지지 않도록 함
+                            elem.clear()
+                            while elem.getprevious() is not None:
+                                del elem.getparent()[0]
+                    except etree.XMLSyntaxError as e:
+                        logger.warning(f"스트리밍 파싱 실패, feedparser로 재시도: {url} - {str(e)}")
+                        parser = None
+            
+            if parser is not None:
+                try:
+                    parser.close()
+                except etree.XMLSyntaxError as e:
+                    logger.warning(f"스트리밍 파싱 실패, feedparser로 재시도: {url} - {str(e)}")
+                    parser = None
+            
+            if parser is None or not entries:
+                spool.seek(0)
+                return feedparser.parse(spool, response_headers=response_headers)
+        return feedparser.FeedParserDict(bozo=0, entries=entries)
+    
+    @staticmethod
+    def _lxml_item_to_entry(elem) -> feedparser.FeedParserDict:
+        """RSS item 요소를 feedparser 엔트리와 같은 키(title, link, summary, published_parsed, tags, content)로 변환"""
+        entry = feedparser.FeedParserDict()
+        for child in elem:
+            if not isinstance(child.tag, str): # 주석/처리 명령 제외
+                continue
+            name = etree.QName(child).localname
+            text = (child.text or '').strip()
+            if name in ('title', 'link'):
+                entry[name] = text
+            elif name == 'description':
+                entry['summary'] = text
+            elif name == 'encoded': # content:encoded
+                entry['content'] = [feedparser.FeedParserDict(type='text/html', value=text)]
+            elif name == 'pubDate' and text:
+                try:
+                    # feedparser와 동일하게 UTC 기준 struct_time으로 저장
+                    entry['published_parsed'] = parsedate_to_datetime(text).utctimetuple()
+                except (TypeError, ValueError):
+                    pass
+            elif name == 'category' and text:
+                entry.setdefault('tags', []).append(feedparser.FeedParserDict(term=text))
+        return entry
+    
     def _parse_date(self, entry) -> datetime:
         """
         피드 엔트리에서 날짜 정보를 추출하여 datetime 객체로 변환
@@ -134,12 +392,14 @@ class RSSCollector:
             entry: feedparser 엔트리
             
         Returns:
-            datetime 객체
+            UTC 기준 naive datetime 객체 (날짜 정보가 없으면 현재 시각)
         """
-        for date_field in ['published_parsed', 'updated_parsed', 'created_parsed']:
-            if hasattr(entry, date_field) and getattr(entry, date_field):
-                time_struct = getattr(entry, date_field)
-                return datetime.fromtimestamp(time.mktime(time_struct))
+        for date_field in ('published_parsed', 'updated_parsed', 'created_parsed'):
+            time_struct = dict.get(entry, date_field)
+            if time_struct:
+                # feedparser의 struct_time은 UTC 기준이므로 필드를 그대로 써서 UTC 기준 naive datetime(벽시계 시각)으로 생성
+                # (의도된 동작: mktime/fromtimestamp 왕복은 struct_time을 로컬 시각으로 해석해 서버 시간대/DST에 따라 결과가 달라짐)
+                return datetime(*time_struct[:6])
         
         # 날짜 정보가 없는 경우 현재 시간 반환
         return datetime.now()
@@ -154,16 +414,18 @@ class RSSCollector:
         Returns:
             추출된 콘텐츠 문자열
         """
-        # content 필드가 있는 경우
-        if hasattr(entry, 'content') and entry.content:
-            for content in entry.content:
-                if content.get('type') == 'text/html':
-                    html_content = content.get('value', '')
-                    return self._clean_html(html_content)
+        # content 필드가 있는 경우: 첫 번째 text/html 항목만 한 번 정리
+        html_content = next(
+            (content.get('value', '') for content in dict.get(entry, 'content') or () if content.get('type') == 'text/html'),
+            None
+        )
+        if html_content is not None:
+            return self._clean_html(html_content)
         
         # content 필드가 없지만 summary가 있는 경우
-        if hasattr(entry, 'summary'):
-            return self._clean_html(entry.summary)
+        summary = dict.get(entry, 'summary')
+        if summary is not None:
+            return self._clean_html(summary)
         
         # 둘 다 없는 경우 빈 문자열 반환
         return ""
@@ -173,49 +435,48 @@ class RSSCollector:
         if not html_content:
             return ""
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        # Get text with spaces as separators, strip outer whitespace
-        text = soup.get_text(separator=' ', strip=True)
-        # Collapse multiple whitespace characters into a single space
-        text = re.sub(r'\s+', ' ', text)
-        # Remove space before common punctuation marks
-        text = re.sub(r'\s+([.,!?])', r'\1', text)
+        if '<' in html_content or '&' in html_content:
+            # 태그/엔티티가 있을 때만 파싱 (script/style 내용 제외, 따옴표 속성/닫히지 않은 태그/CDATA도 처리)
+            soup = BeautifulSoup(html_content, 'html.parser')
+            text = soup.get_text(separator=' ', strip=True)
+        else:
+            text = html_content
+        # 공백 압축과 구두점 앞 공백 제거를 한 번에 처리
+        text = _WHITESPACE_RE.sub(_replace_whitespace, text)
         # Strip any leading/trailing whitespace that might remain
         return text.strip()
     
     def _extract_tags(self, entry) -> List[str]:
         """피드 엔트리에서 태그를 추출"""
-        tags = set() # Use set for automatic duplicate removal
+        tags: Dict[str, None] = {} # dict 키로 중복 제거 (처음 등장한 순서 유지)
         
-        # tags 필드 처리
-        if hasattr(entry, 'tags'):
-            for tag in entry.tags:
-                tag_term = tag.get('term')
-                if tag_term:
-                    tags.add(tag_term.strip())
+        # tags 필드 처리 (FeedParserDict.__getattr__ 대체 키 탐색 없이 dict에서 바로 조회)
+        for tag in dict.get(entry, 'tags') or ():
+            tag_term = tag.get('term')
+            if tag_term:
+                tags[tag_term.strip()] = None
         
         # categories 필드 처리
-        if hasattr(entry, 'categories'):
-            for category_list in entry.categories:
-                # Check if category_list is iterable (list/tuple) and not a string
-                if hasattr(category_list, '__iter__') and not isinstance(category_list, str):
-                    for category_item in category_list:
-                        # Handle potential inner tuples or strings
-                        cat_name = None
-                        if isinstance(category_item, (tuple, list)) and len(category_item) > 0:
-                             cat_name = category_item[0]
-                        elif isinstance(category_item, str):
-                             cat_name = category_item
-                        
-                        if cat_name:
-                            tags.add(cat_name.strip())
-                # Handle case where category is just a string
-                elif isinstance(category_list, str):
-                    if category_list: # Ensure not empty string
-                       tags.add(category_list.strip())
-                       
-        # Return sorted list for consistent test results
-        return sorted(list(tags))
+        for category_list in dict.get(entry, 'categories') or ():
+            # Check if category_list is iterable (list/tuple) and not a string
+            if hasattr(category_list, '__iter__') and not isinstance(category_list, str):
+                for category_item in category_list:
+                    # Handle potential inner tuples or strings
+                    cat_name = None
+                    if isinstance(category_item, (tuple, list)) and len(category_item) > 0:
+                         cat_name = category_item[0]
+                    elif isinstance(category_item, str):
+                         cat_name = category_item
+                    
+                    if cat_name:
+                        tags[cat_name.strip()] = None
+            # Handle case where category is just a string
+            elif isinstance(category_list, str):
+                if category_list: # Ensure not empty string
+                   tags[category_list.strip()] = None
+                   
+        # 피드에 나타난 순서 그대로 반환 (정렬 없이도 결과가 결정적)
+        return list(tags)
     
     def _remove_duplicates(self, items: List[FeedItem]) -> List[FeedItem]:
         """
@@ -252,27 +513,10 @@ class RSSCollector:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = RAW_FEEDS_DIR / f"feeds_{timestamp}.json"
         
-        # JSON으로 변환하여 저장
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(
-                [item.model_dump() for item in items],  # dict() 대신 model_dump() 사용
-                f,
-                ensure_ascii=False,
-                indent=2,
-                default=self._json_serializer
-            )
+        # JSON으로 변환하여 저장 (datetime/HttpUrl 필드도 직렬화기가 처리하므로 중간 dict/문자열 없이 한 번에 기록)
+        filename.write_bytes(_FEED_LIST_ADAPTER.dump_json(items, indent=2))
         
         logger.info(f"피드 결과 저장 완료: {filename}")
-    
-    def _json_serializer(self, obj):
-        """JSON 직렬화를 위한 도우미 함수"""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        try:
-            # 다양한 유형의 객체에 대해 문자열 변환 시도
-            return str(obj)
-        except:
-            raise TypeError(f"Type {type(obj)} not serializable")
 
 
 def collect_feeds() -> List[FeedItem]:
@@ -286,6 +530,17 @@ def collect_feeds() -> List[FeedItem]:
     return collector.fetch_all_feeds()
 
 
+async def collect_feeds_async() -> List[FeedItem]:
+    """
+    모든 RSS 피드를 비동기로 수집하는 헬퍼 함수 (이벤트 루프 안에서 사용)
+    
+    Returns:
+        수집된 피드 아이템 목록
+    """
+    collector = RSSCollector()
+    return await collector.fetch_all_feeds_async()
+
+
 if __name__ == "__main__":
     # 모듈 직접 실행 시 테스트
     collect_feeds()
@@ -104,14 +104,23 @@ class BrowserPoolManager:
 
 browser_pool = BrowserPoolManager()
 
+def get_pool() -> BrowserPoolManager:
+    """Returns the browser pool used by the lifespan and tools.
+
+    Tools resolve the pool through this getter on every call instead of holding the
+    module-global instance, so tests can swap in a per-test pool without mutating it.
+    """
+    return browser_pool
+
 # Lifespan events for MCP application
 @asynccontextmanager
 async def lifespan(app: FastMCP):
+    pool = get_pool()
     logger.info("MCP Server lifespan startup...")
-    await browser_pool.initialize()
+    await pool.initialize()
     yield
     logger.info("MCP Server lifespan shutdown...")
-    await browser_pool.shutdown()
+    await pool.shutdown()
 
 # Initialize FastMCP with lifespan management
 crawler_mcp_app = FastMCP(lifespan=lifespan)
@@ -165,20 +174,21 @@ async def _extract_selector_with_retry(page: Page, selector: str, retries: int =
 def launch_browser(ctx: Context):
     """Initializes the browser pool if not already started and reports status."""
     try:
+        pool = get_pool()
         # Initialization might happen automatically via lifespan or context manager
         # This tool can act as a health check or explicit initializer
-        if not browser_pool._initialized:
+        if not pool._initialized:
              logger.info("Tool 'launch_browser' triggered initialization.")
              # In a real scenario, calling initialize might be redundant if lifespan works
-             # await browser_pool.initialize() # Potentially redundant
+             # await pool.initialize() # Potentially redundant
              # For safety, we can just check the status
              return {"status": "pending", "message": "Browser pool is initializing..."}
         
-        available_count = browser_pool._browser_queue.qsize() if browser_pool._browser_queue else 0
+        available_count = pool._browser_queue.qsize() if pool._browser_queue else 0
         return {
             "status": "success",
-            "message": f"Browser pool is initialized. Pool size: {browser_pool.pool_size}. Available now: {available_count}",
-            "pool_size": browser_pool.pool_size,
+            "message": f"Browser pool is initialized. Pool size: {pool.pool_size}. Available now: {available_count}",
+            "pool_size": pool.pool_size,
             "available_now": available_count
         }
     except Exception as e:
@@ -192,7 +202,7 @@ async def crawl_page(ctx: Context, url: str):
         return {"status": "error", "message": "Invalid URL provided."}
 
     try:
-        async with browser_pool.get_managed_browser() as browser:
+        async with get_pool().get_managed_browser() as browser:
             page = await browser.new_page()
             logger.info(f"Opened new page for crawling {url}")
             response = await _goto_with_retry(page, url)
@@ -232,7 +242,7 @@ async def extract_content(ctx: Context, url: str, selectors: List[str]):
     page = None # Define page outside try to ensure close in finally
     
     try:
-        async with browser_pool.get_managed_browser() as browser:
+        async with get_pool().get_managed_browser() as browser:
             page = await browser.new_page()
             logger.info(f"Opened new page for extracting content from {url}")
             response = await _goto_with_retry(page, url)
@@ -11,7 +11,7 @@ from mcp.server.fastmcp import FastMCP, Context
 # Context import 제거 (API 변경으로 추정)
 # from mcp.types import Context 
 
-from app.collector.rss_collector import collect_feeds
+from app.collector.rss_collector import collect_feeds_async
 from app.config import (
     DATA_DIR, MCP_ENABLED, MCP_HOST, MCP_PORT, RSS_SOURCES, 
     FILTERED_FEEDS_DIR, RAW_FEEDS_DIR, SUMMARIES_DIR,
@@ -67,7 +67,7 @@ async def collect_rss_feeds_tool(ctx: Context, refresh: bool = False) -> Dict:
         
         # 피드 수집 실행
         await ctx.report_progress(f"RSS 피드 {len(RSS_SOURCES)}개 소스에서 수집 시작...")
-        items = collect_feeds()
+        items = await collect_feeds_async()
         
         await ctx.report_progress(f"RSS 피드 수집 완료: {len(items)}개 피드 수집됨")
         
@@ -119,7 +119,7 @@ async def get_latest_feeds_tool(
         if not feed_files:
             # 파일이 없으면 새로 수집
             await ctx.report_progress("저장된 피드가 없어 새로 수집합니다...")
-            items = collect_feeds()
+            items = await collect_feeds_async()
             await ctx.report_progress(f"RSS 피드 수집 완료: {len(items)}개 피드 수집됨")
         else:
             # 최신 파일 사용
@@ -2,7 +2,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
-from sqlalchemy import create_engine, update
+from sqlalchemy import Engine, create_engine, update
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -30,6 +30,14 @@ class SQLiteMonitoringRepository:
             logger.error(f"Failed to initialize SQLiteMonitoringRepository: {e}", exc_info=True)
             raise
 
+    @classmethod
+    def from_engine(cls, engine: Engine, session_factory: Optional[sessionmaker] = None) -> "SQLiteMonitoringRepository":
+        """이미 생성된 엔진(및 세션 팩토리)을 공유하는 저장소를 생성합니다. (엔진 생성을 생략)"""
+        repo = cls.__new__(cls)
+        repo.engine = engine
+        repo.SessionLocal = session_factory or sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        return repo
+
     # 테이블 생성 로직은 앱 초기화 또는 다른 저장소에서 관리하는 것으로 가정
     # def _create_monitoring_table(self):
     #     try:
@@ -1,7 +1,7 @@
 import logging
 from typing import List, Optional, Any, Dict, Generator
 from contextlib import contextmanager
-from sqlalchemy import create_engine, select, update, delete, func, inspect, text
+from sqlalchemy import Engine, create_engine, select, insert, update, delete, func, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
@@ -29,6 +29,14 @@ class SQLiteRepository(BaseRepository):
             logger.error(f"Failed to initialize SQLiteRepository: {e}", exc_info=True)
             raise
 
+    @classmethod
+    def from_engine(cls, engine: Engine, session_factory: Optional[sessionmaker] = None) -> "SQLiteRepository":
+        """이미 생성된 엔진(및 세션 팩토리)을 공유하는 저장소를 생성합니다. (엔진 생성과 테이블 확인을 생략)"""
+        repo = cls.__new__(cls)
+        repo.engine = engine
+        repo.SessionLocal = session_factory or sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        return repo
+
     def _create_tables(self):
         """데이터베이스에 테이블이 없으면 생성합니다."""
         try:
@@ -57,9 +65,9 @@ class SQLiteRepository(BaseRepository):
         finally:
             db.close()
 
-    def _map_pydantic_to_db(self, data: CollectedData) -> CollectedDataDB:
-        """Pydantic 모델을 SQLAlchemy 모델로 변환 (단순 매핑)"""
-        db_data = CollectedDataDB(
+    def _map_pydantic_to_row(self, data: CollectedData) -> Dict[str, Any]:
+        """Pydantic 모델을 collected_data 테이블 컬럼 딕셔너리로 변환 (단순 매핑)"""
+        return dict(
             id=data.id,
             source_url=str(data.source_url), # HttpUrl -> str
             source_type=data.source_type, # 이미 str 값 (use_enum_values=True)
@@ -76,7 +84,10 @@ class SQLiteRepository(BaseRepository):
             processing_status=data.processing_status, # 이미 str 값 (use_enum_values=True)
             extra_data=data.extra_data
         )
-        return db_data
+
+    def _map_pydantic_to_db(self, data: CollectedData) -> CollectedDataDB:
+        """Pydantic 모델을 SQLAlchemy 모델로 변환"""
+        return CollectedDataDB(**self._map_pydantic_to_row(data))
 
     def _map_db_to_pydantic(self, db_data: CollectedDataDB) -> CollectedData:
         """SQLAlchemy 모델을 Pydantic 모델로 변환"""
@@ -144,28 +155,29 @@ class SQLiteRepository(BaseRepository):
     async def save_bulk_data(self, data_list: List[CollectedData]) -> List[CollectedData]:
         """여러 데이터 항목을 한 번에 저장합니다. (중복 체크 없음)"""
         saved_items = []
-        db_items = []
+        rows = []
         ids_to_save = set()
         for data in data_list:
              # 간단한 ID 중복 방지
              if data.id not in ids_to_save:
-                 db_items.append(self._map_pydantic_to_db(data))
+                 rows.append(self._map_pydantic_to_row(data))
                  ids_to_save.add(data.id)
 
-        if not db_items:
+        if not rows:
              return []
 
         try:
              with self.get_db() as db:
                  # TODO: 벌크 저장 시 DB 레벨에서 ID 충돌 처리 확인 필요 (DB 종류에 따라 다름)
                  # SQLite의 경우 INSERT OR IGNORE 등을 고려할 수 있으나, ORM에서는 복잡할 수 있음.
-                 # 우선은 add_all 후 commit 시 예외 발생 가능성 있음.
-                 db.add_all(db_items)
+                 # 우선은 commit 전 INSERT 단계에서 예외 발생 가능성 있음.
+                 # ORM 객체를 만들지 않고 단일 INSERT 문 + 파라미터 목록(executemany)으로 저장
+                 db.execute(insert(CollectedDataDB), rows)
                  db.commit()
                  # 벌크 저장 후 refresh는 어려우므로, 입력 데이터를 기반으로 반환
                  # DB 기본값(collected_at 등)은 반영되지 않을 수 있음
                  saved_items = [d for d in data_list if d.id in ids_to_save]
-                 logger.info(f"Attempted to save {len(db_items)} items in bulk. Result count: {len(saved_items)}")
+                 logger.info(f"Attempted to save {len(rows)} items in bulk. Result count: {len(saved_items)}")
                  return saved_items
         except SQLAlchemyError as e:
              logger.error(f"Failed to save bulk data: {e}", exc_info=True)
@@ -1,6 +1,7 @@
-import Levenshtein
 import logging
 
+from rapidfuzz.distance import Indel
+
 logger = logging.getLogger(__name__)
 
 def is_title_duplicate(title1: str, title2: str, threshold: float = 0.8) -> bool:
@@ -9,8 +10,8 @@ def is_title_duplicate(title1: str, title2: str, threshold: float = 0.8) -> bool
         # 제목 중 하나라도 없으면 중복으로 판단하지 않음
         return False
         
-    # Levenshtein.ratio() 사용 (0~1 사이 유사도 반환)
-    similarity = Levenshtein.ratio(title1.lower(), title2.lower())
+    # rapidfuzz Indel 정규화 유사도 사용 (python-Levenshtein의 Levenshtein.ratio()와 동일한 0~1 값, 비트 병렬 C++ 구현)
+    similarity = Indel.normalized_similarity(title1.lower(), title2.lower())
     is_duplicate = similarity >= threshold
     
     if is_duplicate:
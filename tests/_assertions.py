@@ -0,0 +1,17 @@
+"""
+테스트 공용 검증 헬퍼
+"""
+import logging
+
+
+def assert_logged(caplog, level: int, substr: str) -> None:
+    """level 이상으로 기록된 로그 레코드 중 substr을 포함하는 메시지가 있는지 확인
+
+    caplog.text는 접근할 때마다 모든 레코드를 문자열로 합치므로,
+    레코드의 메시지를 직접 검사합니다.
+    """
+    assert any(
+        substr in record.getMessage()
+        for record in caplog.records
+        if record.levelno >= level
+    ), f"No log record at level >= {logging.getLevelName(level)} containing {substr!r}"
@@ -0,0 +1,50 @@
+"""
+테스트 공용 샘플 데이터 팩토리
+
+무거운 모듈(FastAPI 앱, 저장소 등)을 임포트하지 않으므로
+여러 테스트 모듈에서 수집 비용 없이 재사용할 수 있습니다.
+"""
+from typing import List
+from datetime import datetime, timezone
+from pydantic import HttpUrl
+
+from app.models.collected_data import CollectedData
+from app.models.enums import SourceType, ProcessingStatus
+
+# 샘플 데이터 공통 상수 (호출마다 Enum 조회를 반복하지 않도록 모듈 로드 시 한 번만 해석)
+_SOURCE = SourceType.RSS
+_STATUS = ProcessingStatus.PENDING
+_CATS = ["AI", "Test"]
+
+# 테스트용 샘플 데이터 생성 함수
+def create_sample_data(count: int) -> List[CollectedData]:
+    base_time = datetime.now(timezone.utc)
+    # 모든 샘플에 공통인 필드는 템플릿 모델에서 한 번만 검증하고,
+    # 인덱스별로 달라지는 필드만 model_copy(update=...)로 교체 (전체 재검증 생략)
+    template = CollectedData(
+        id="test-id-template",
+        source_url="http://example.com/0",
+        source_type=_SOURCE,
+        collected_at=base_time,
+        published_at=base_time,
+        categories=_CATS,
+        relevance_score=0.8,
+        processing_status=_STATUS,
+    )
+    # model_copy는 검증을 거치지 않으므로 URL 필드는 HttpUrl로 직접 생성해 타입을 유지
+    # 얕은 복사이므로 리스트 필드(categories 등)는 샘플마다 새 리스트를 넣어 샘플/테스트 간 공유를 막음
+    return [
+        template.model_copy(update={
+            "id": f"test-id-{i}",
+            "categories": list(_CATS),
+            "source_url": HttpUrl(f"http://example.com/{i}"),
+            "title": f"Test Title {i}",
+            "link": HttpUrl(f"http://example.com/article/{i}"),
+            "summary": f"Test Summary {i}",
+            "content": f"Test Content {i}",
+            "author": f"Author {i}",
+            "tags": ["test", f"sample-{i}"],
+            "extra_data": {"key": f"value{i}"},
+        })
+        for i in range(count)
+    ]
@@ -0,0 +1,60 @@
+"""
+에이전트 도구 테스트 공용 설정
+
+도구 테스트는 항상 "사용되는 곳"을 패치해야 합니다.
+(예: 'app.agents.tools.data_management_tools.get_repository')
+'app.repository.*' / 'app.scheduler.*' 같은 원본 모듈을 패치하면 해당 객체를 사용하는
+모든 모듈에 패치가 전파되어, 테스트 간 누수나 느려짐/메모리 폭증으로 이어질 수 있습니다.
+수집 시점에 이러한 패치 대상을 찾아 경고합니다.
+"""
+import ast
+import warnings
+from pathlib import Path
+
+import pytest
+
+# 도구 테스트에서 직접 패치하면 안 되는 원본 모듈 경로
+FORBIDDEN_PATCH_PREFIXES = ("app.repository.", "app.scheduler.")
+# 문자열 대상 경로를 첫 번째 인자로 받는 패치 함수 이름 (patch, mocker.patch, monkeypatch.setattr)
+PATCH_CALL_NAMES = {"patch", "setattr"}
+
+_CONFTEST_DIR = Path(__file__).parent
+
+
+class SourceModulePatchWarning(pytest.PytestWarning):
+    """원본 모듈을 패치하는 테스트를 발견했을 때 발생하는 경고"""
+
+
+def _find_source_module_patches(path: Path):
+    """모듈 소스에서 금지된 패치 대상 (줄 번호, 대상 경로) 목록을 반환"""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not node.args:
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else func.attr if isinstance(func, ast.Attribute) else None
+        target = node.args[0]
+        if (
+            name in PATCH_CALL_NAMES
+            and isinstance(target, ast.Constant)
+            and isinstance(target.value, str)
+            and target.value.startswith(FORBIDDEN_PATCH_PREFIXES)
+        ):
+            found.append((node.lineno, target.value))
+    return found
+
+
+def pytest_collection_modifyitems(config, items):
+    """이 디렉터리의 테스트 모듈에서 원본 모듈 패치를 찾아 경고"""
+    checked = set()
+    for item in items:
+        path = Path(item.fspath)
+        if path in checked or _CONFTEST_DIR not in path.parents:
+            continue
+        checked.add(path)
+        for lineno, target in _find_source_module_patches(path):
+            warnings.warn(SourceModulePatchWarning(
+                f"{path.name}:{lineno} patches '{target}' at its source module; "
+                f"patch the name where it is used (e.g. 'app.agents.tools.<module>.<name>') instead."
+            ))
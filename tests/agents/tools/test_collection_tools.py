@@ -1,6 +1,5 @@
-import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from typing import List, Optional
+from typing import Optional
 from pydantic import HttpUrl
 import httpx # HTTPStatusError, RequestError 임포트를 위해 추가
 
@@ -11,45 +10,18 @@ from app.agents.tools.collection_tools import (
     CollectRssInput,
     CrawlInput
 )
+from app.config import USER_AGENT
 from app.models.collected_data import CollectedData
 from app.models.enums import SourceType, ProcessingStatus
 
-# 테스트용 샘플 데이터 생성 함수 (다른 테스트 파일에서 가져오거나 여기서 정의)
-try:
-    from tests.api.test_collection_api import create_sample_data
-except ImportError:
-    from datetime import datetime, timezone
-    from app.models.enums import ProcessingStatus
-    def create_sample_data(count: int, source_type: SourceType = SourceType.RSS) -> List[CollectedData]:
-        # ... (샘플 데이터 생성 로직, source_type 인자 추가) ...
-        samples = []
-        base_time = datetime.now(timezone.utc)
-        for i in range(count):
-            samples.append(CollectedData(
-                id=f"test-{source_type.value}-id-{i}",
-                source_url=f"http://example.com/{source_type.value}/{i}",
-                source_type=source_type,
-                collected_at=base_time,
-                title=f"Test {source_type.value} Title {i}",
-                link=f"http://example.com/article/{i}",
-                published_at=base_time,
-                summary=f"Test Summary {i}",
-                content=f"Test Content {i}",
-                author=f"Author {i}",
-                categories=["AI", "Test"],
-                tags=["test", f"sample-{i}"],
-                relevance_score=0.8,
-                processing_status=ProcessingStatus.RAW, # RAW 상태로 생성
-                extra_data={"key": f"value{i}"}
-            ))
-        return samples
+# 테스트용 샘플 데이터 팩토리
+from tests._factories import create_sample_data
 
 
 # --- Tests for collect_rss_feeds_tool ---
 
 # parse_rss_feed 함수를 모의 처리하기 위한 patch 데코레이터 사용
 @patch('app.agents.tools.collection_tools.parse_rss_feed', new_callable=AsyncMock)
-@pytest.mark.asyncio
 async def test_collect_rss_specific_urls(mock_parse_rss: AsyncMock):
     """특정 URL 입력 시 해당 URL에 대해서만 parse_rss_feed 호출 확인"""
     test_urls = [HttpUrl("http://test.com/rss1"), HttpUrl("http://test.com/rss2")]
@@ -85,7 +57,6 @@ async def test_collect_rss_specific_urls(mock_parse_rss: AsyncMock):
     {"url": "http://config.com/rss1", "category": "ConfigCat1"},
     {"url": "http://config.com/rss2", "category": "ConfigCat2"},
 ])
-@pytest.mark.asyncio
 async def test_collect_rss_all_urls(mock_parse_rss: AsyncMock):
     """입력 URL 없을 때 설정된 모든 URL에 대해 parse_rss_feed 호출 확인"""
     # side_effect에서 생성되는 샘플 데이터의 source_url 지정
@@ -112,7 +83,6 @@ async def test_collect_rss_all_urls(mock_parse_rss: AsyncMock):
     assert result[1].source_url == "http://config.com/rss2"
 
 @patch('app.agents.tools.collection_tools.parse_rss_feed', new_callable=AsyncMock)
-@pytest.mark.asyncio
 async def test_collect_rss_partial_failure(mock_parse_rss: AsyncMock):
     """일부 피드 파싱 실패 시 성공한 결과만 반환하는지 확인"""
     test_urls = [HttpUrl("http://ok.com/rss"), HttpUrl("http://fail.com/rss")]
@@ -140,7 +110,6 @@ async def test_collect_rss_partial_failure(mock_parse_rss: AsyncMock):
 
 # httpx.AsyncClient를 patch할 때, 올바른 경로 지정이 중요
 @patch('app.agents.tools.collection_tools.httpx.AsyncClient')
-@pytest.mark.asyncio
 async def test_crawl_valid_page(mock_async_client_cls):
     """유효한 페이지 크롤링 성공 시 CollectedData 반환 확인"""
     mock_response = MagicMock(spec=httpx.Response)
@@ -156,7 +125,6 @@ async def test_crawl_valid_page(mock_async_client_cls):
     input_data = CrawlInput(url=test_url)
     result = await crawl_webpage_tool(input_data)
 
-    from app.config import USER_AGENT
     mock_client_instance.get.assert_called_once_with(str(test_url), headers={'User-Agent': USER_AGENT})
 
     # 결과 검증 강화
@@ -172,7 +140,6 @@ async def test_crawl_valid_page(mock_async_client_cls):
     assert result.processing_status == ProcessingStatus.RAW # RAW 상태 확인
 
 @patch('app.agents.tools.collection_tools.httpx.AsyncClient')
-@pytest.mark.asyncio
 async def test_crawl_invalid_url(mock_async_client_cls, caplog):
     """잘못된 URL 또는 HTTP 오류 시 None 반환 및 로그 기록 확인"""
     # --- HTTP 404 오류 시나리오 ---
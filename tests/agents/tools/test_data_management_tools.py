@@ -1,6 +1,7 @@
+import logging
 import pytest
 from unittest.mock import AsyncMock, patch
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 
 # 테스트 대상 도구 임포트
 from app.agents.tools.data_management_tools import (
@@ -8,43 +9,19 @@ from app.agents.tools.data_management_tools import (
     save_collected_data_tool,
     GetDataInput
 )
-from app.models.collected_data import CollectedData
 from app.repository.base import BaseRepository
 
-# 테스트용 샘플 데이터 (test_collection_api.py 와 유사하게 사용 가능)
-# tests.api.test_collection_api 모듈이 존재하고 create_sample_data 함수가 있다고 가정
-# 경로 문제가 발생하면 sys.path 조정 또는 fixture 형태로 샘플 데이터 제공 필요
-try:
-    from tests.api.test_collection_api import create_sample_data
-except ImportError:
-    # 대체 샘플 데이터 생성 함수 (실제 API 테스트와 동일하게 유지 권장)
-    from datetime import datetime, timezone
-    from app.models.enums import SourceType, ProcessingStatus
-    def create_sample_data(count: int) -> List[CollectedData]:
-        samples = []
-        base_time = datetime.now(timezone.utc)
-        for i in range(count):
-            samples.append(CollectedData(
-                id=f"test-id-{i}",
-                source_url=f"http://example.com/{i}",
-                source_type=SourceType.RSS,
-                collected_at=base_time,
-                title=f"Test Title {i}",
-                link=f"http://example.com/article/{i}",
-                published_at=base_time,
-                summary=f"Test Summary {i}",
-                content=f"Test Content {i}",
-                author=f"Author {i}",
-                categories=["AI", "Test"],
-                tags=["test", f"sample-{i}"],
-                relevance_score=0.8,
-                processing_status=ProcessingStatus.PENDING,
-                extra_data={"key": f"value{i}"}
-            ))
-        return samples
+# 테스트용 샘플 데이터 팩토리
+from tests._factories import create_sample_data
+from tests._assertions import assert_logged
 
 # --- Fixtures ---
 
+@pytest.fixture(scope="module")
+def one_datum():
+    """저장 도구 테스트에서 공유하는 단일 CollectedData (저장소가 모의 객체이므로 재사용해도 무방)"""
+    return create_sample_data(1)[0]
+
 @pytest.fixture
 def mock_repository():
     """모의 BaseRepository 인스턴스를 생성하는 fixture"""
@@ -61,7 +38,6 @@ def patch_get_repository(mock_repository):
 
 # --- Tests for get_collected_data_tool ---
 
-@pytest.mark.asyncio
 async def test_get_data_no_query(mock_repository: AsyncMock):
     """쿼리 없이 호출 시 get_all_data 호출 및 결과 반환 확인"""
     sample_data = create_sample_data(3)
@@ -74,7 +50,6 @@ async def test_get_data_no_query(mock_repository: AsyncMock):
     mock_repository.find_data.assert_not_called() # find_data는 호출 안 됨
     assert result == sample_data
 
-@pytest.mark.asyncio
 async def test_get_data_with_query(mock_repository: AsyncMock):
     """쿼리 포함 호출 시 find_data 호출 및 결과 반환 확인"""
     sample_data = create_sample_data(2)
@@ -88,7 +63,6 @@ async def test_get_data_with_query(mock_repository: AsyncMock):
     mock_repository.get_all_data.assert_not_called() # get_all_data는 호출 안 됨
     assert result == sample_data
 
-@pytest.mark.asyncio
 async def test_get_data_pagination(mock_repository: AsyncMock):
     """페이지네이션 파라미터 전달 확인 (get_all_data) """
     mock_repository.get_all_data.return_value = [] # 결과는 중요하지 않음
@@ -96,7 +70,6 @@ async def test_get_data_pagination(mock_repository: AsyncMock):
     await get_collected_data_tool(input_data)
     mock_repository.get_all_data.assert_called_once_with(limit=7, skip=3)
 
-@pytest.mark.asyncio
 async def test_get_data_empty_result(mock_repository: AsyncMock):
     """조회 결과 없을 때 빈 리스트 반환 확인"""
     mock_repository.get_all_data.return_value = []
@@ -104,23 +77,11 @@ async def test_get_data_empty_result(mock_repository: AsyncMock):
     result = await get_collected_data_tool(input_data)
     assert result == []
 
-@pytest.mark.asyncio
-async def test_get_data_repository_error(mock_repository: AsyncMock, caplog):
-    """저장소 오류 발생 시 빈 리스트 반환 및 로그 기록 확인"""
-    mock_repository.get_all_data.side_effect = Exception("DB connection error")
-    input_data = GetDataInput()
-    result = await get_collected_data_tool(input_data)
-
-    assert result == []
-    assert "Error in get_collected_data_tool" in caplog.text
-    assert "DB connection error" in caplog.text
-
 # --- Tests for save_collected_data_tool ---
 
-@pytest.mark.asyncio
-async def test_save_data_success(mock_repository: AsyncMock):
+async def test_save_data_success(mock_repository: AsyncMock, one_datum):
     """새 데이터 저장 성공 시 저장된 객체 반환 확인"""
-    new_data = create_sample_data(1)[0]
+    new_data = one_datum
     # save_data가 성공 시 저장된 객체(또는 동일 객체)를 반환한다고 가정
     mock_repository.save_data.return_value = new_data
 
@@ -129,10 +90,9 @@ async def test_save_data_success(mock_repository: AsyncMock):
     mock_repository.save_data.assert_called_once_with(data=new_data)
     assert result == new_data
 
-@pytest.mark.asyncio
-async def test_save_data_duplicate(mock_repository: AsyncMock, caplog):
+async def test_save_data_duplicate(mock_repository: AsyncMock, caplog, one_datum):
     """중복 데이터 저장 시도 시 None 반환 및 로그 기록 확인"""
-    duplicate_data = create_sample_data(1)[0]
+    duplicate_data = one_datum
     # save_data가 중복 시 None을 반환한다고 가정
     mock_repository.save_data.return_value = None
 
@@ -140,20 +100,23 @@ async def test_save_data_duplicate(mock_repository: AsyncMock, caplog):
 
     mock_repository.save_data.assert_called_once_with(data=duplicate_data)
     assert result is None
-    assert "was not saved (likely duplicate or error)" in caplog.text
+    assert_logged(caplog, logging.WARNING, "was not saved (likely duplicate or error)")
 
 # Pydantic 모델 자체에서 유효성 검사가 일어나므로, 도구 레벨에서 invalid data 테스트는 생략 가능
 # 만약 도구 내에서 추가적인 유효성 검사가 있다면 해당 로직 테스트 필요
 
-@pytest.mark.asyncio
-async def test_save_data_repository_error(mock_repository: AsyncMock, caplog):
-    """저장소 오류 발생 시 None 반환 및 로그 기록 확인"""
-    error_data = create_sample_data(1)[0]
-    mock_repository.save_data.side_effect = Exception("DB write error")
+# --- Repository error cases ---
 
-    result = await save_collected_data_tool(error_data)
+@pytest.mark.parametrize("tool, method, make_input, sentinel, log_prefix", [
+    (get_collected_data_tool, "get_all_data", lambda datum: GetDataInput(), [], "Error in get_collected_data_tool"),
+    (save_collected_data_tool, "save_data", lambda datum: datum, None, "Error in save_collected_data_tool"),
+], ids=["get_data", "save_data"])
+async def test_repository_error(mock_repository: AsyncMock, caplog, one_datum, tool, method, make_input, sentinel, log_prefix):
+    """저장소 오류 발생 시 기본값(sentinel) 반환 및 로그 기록 확인"""
+    getattr(mock_repository, method).side_effect = Exception("boom")
 
-    mock_repository.save_data.assert_called_once_with(data=error_data)
-    assert result is None
-    assert "Error in save_collected_data_tool" in caplog.text
-    assert "DB write error" in caplog.text
+    result = await tool(make_input(one_datum))
+
+    getattr(mock_repository, method).assert_called_once()
+    assert result == sentinel
+    assert_logged(caplog, logging.ERROR, f"{log_prefix}: boom")
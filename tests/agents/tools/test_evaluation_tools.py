@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 from pydantic import HttpUrl
 
 # 테스트 대상 도구 임포트
@@ -8,23 +8,36 @@ from app.agents.tools.evaluation_tools import (
     EvaluateSourceInput,
     EvaluationResult
 )
-# random 모듈 임포트 (패치 대상)
-import random
+
+# --- Fixtures ---
+
+@pytest.fixture(autouse=True)
+def mock_uniform(monkeypatch):
+    """random.uniform을 모의 객체로 교체하는 fixture (모든 테스트에 자동 적용)"""
+    mock = MagicMock()
+    monkeypatch.setattr("app.agents.tools.evaluation_tools.random.uniform", mock)
+    return mock
+
+@pytest.fixture(scope="module")
+def test_urls():
+    """테스트용 HttpUrl을 모듈 단위로 한 번만 생성하는 fixture"""
+    return {
+        "news": HttpUrl("http://test-source.com/news"),
+        "org": HttpUrl("http://another-source.org"),
+    }
 
 # --- Tests for evaluate_source_quality_tool (Temporary Implementation) ---
 
-@patch('app.agents.tools.evaluation_tools.random.uniform') # random.uniform 패치
-@pytest.mark.asyncio
-async def test_evaluate_returns_result(mock_random_uniform: patch):
+async def test_evaluate_returns_result(mock_uniform: MagicMock, test_urls):
     """유효한 URL 입력 시 EvaluationResult 객체 반환 확인 (임시 구현 기준)"""
     mock_score = 0.75 # 모의 점수 설정
-    mock_random_uniform.return_value = mock_score
-    test_url = HttpUrl("http://test-source.com/news")
+    mock_uniform.return_value = mock_score
+    test_url = test_urls["news"]
     input_data = EvaluateSourceInput(source_url=test_url)
 
     result = await evaluate_source_quality_tool(input_data)
 
-    mock_random_uniform.assert_called_once_with(0.5, 0.95) # 호출 인자 확인
+    mock_uniform.assert_called_once_with(0.5, 0.95) # 호출 인자 확인
     assert isinstance(result, EvaluationResult)
     assert result.source_url == test_url
     # round 처리된 값 비교
@@ -32,14 +45,10 @@ async def test_evaluate_returns_result(mock_random_uniform: patch):
     assert isinstance(result.reasoning, str) # 임시 근거 문자열 확인
     assert str(test_url) in result.reasoning # URL이 근거에 포함되는지 확인
 
-@patch('app.agents.tools.evaluation_tools.random.uniform')
-@pytest.mark.asyncio
-async def test_evaluate_score_is_rounded(mock_random_uniform: patch):
+async def test_evaluate_score_is_rounded(mock_uniform: MagicMock, test_urls):
     """반환된 점수가 소수점 둘째 자리로 반올림되는지 확인"""
-    mock_score = 0.833333
-    mock_random_uniform.return_value = mock_score
-    test_url = HttpUrl("http://another-source.org")
-    input_data = EvaluateSourceInput(source_url=test_url)
+    mock_uniform.return_value = 0.833333
+    input_data = EvaluateSourceInput(source_url=test_urls["org"])
 
     result = await evaluate_source_quality_tool(input_data)
 
@@ -1,7 +1,9 @@
+import logging
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 # 테스트 대상 도구 임포트
+from app.agents.tools import monitoring_tools
 from app.agents.tools.monitoring_tools import (
     log_monitoring_start_tool,
     log_monitoring_end_tool,
@@ -9,108 +11,97 @@ from app.agents.tools.monitoring_tools import (
     LogEndInput
 )
 from app.models.enums import MonitoringStatus # 상태 Enum 임포트
+from app.repository.monitoring_store import SQLiteMonitoringRepository
+from tests._assertions import assert_logged
+
+# 이 모듈의 도구와 저장소 메서드는 모두 동기 함수이므로 asyncio 마커/이벤트 루프가 필요 없습니다.
 
 # --- Fixtures ---
 
 @pytest.fixture(autouse=True)
-def patch_monitoring_store():
-    """monitoring_store 객체를 모의 객체로 패치하는 fixture"""
-    # 'app.agents.tools.monitoring_tools' 모듈 내의 monitoring_store를 패치
-    with patch('app.agents.tools.monitoring_tools.monitoring_store', new_callable=MagicMock) as mock_store:
-        # 각 테스트에서 구체적인 반환값 설정 가능하도록 mock_store 반환
-        yield mock_store
+def mock_store():
+    """monitoring_tools가 사용할 저장소를 모의 객체로 주입하는 fixture"""
+    # spec으로 동기 저장소 클래스를 지정해 log_start/log_end가 AsyncMock이 아닌 MagicMock이 되도록 보장
+    store = MagicMock(spec=SQLiteMonitoringRepository)
+    monitoring_tools._store_override = store
+    # 각 테스트에서 구체적인 반환값 설정 가능하도록 모의 저장소 반환
+    yield store
+    monitoring_tools._store_override = None
 
 # --- Tests for log_monitoring_start_tool ---
 
-def test_log_start_success(patch_monitoring_store: MagicMock):
+def test_log_start_success(mock_store: MagicMock):
     """작업 시작 로그 기록 성공 및 log ID 반환 확인"""
     expected_log_id = 123
-    patch_monitoring_store.log_start.return_value = expected_log_id
+    mock_store.log_start.return_value = expected_log_id
     task_name = "test_task_start"
     input_data = LogStartInput(task_name=task_name)
 
     result = log_monitoring_start_tool(input_data)
 
-    patch_monitoring_store.log_start.assert_called_once_with(task_name)
+    mock_store.log_start.assert_called_once_with(task_name)
     assert result == expected_log_id
 
-def test_log_start_repo_returns_none(patch_monitoring_store: MagicMock, caplog):
+def test_log_start_repo_returns_none(mock_store: MagicMock, caplog):
     """저장소 log_start가 None 반환 시 None 반환 및 로그 확인"""
-    patch_monitoring_store.log_start.return_value = None
+    mock_store.log_start.return_value = None
     task_name = "failed_start_task"
     input_data = LogStartInput(task_name=task_name)
 
     result = log_monitoring_start_tool(input_data)
 
-    patch_monitoring_store.log_start.assert_called_once_with(task_name)
-    assert result is None
-    assert f"Failed to start monitoring log for task '{task_name}'" in caplog.text
-
-def test_log_start_repo_error(patch_monitoring_store: MagicMock, caplog):
-    """저장소 log_start에서 예외 발생 시 None 반환 및 로그 확인"""
-    error_message = "Database connection failed"
-    patch_monitoring_store.log_start.side_effect = Exception(error_message)
-    task_name = "error_start_task"
-    input_data = LogStartInput(task_name=task_name)
-
-    result = log_monitoring_start_tool(input_data)
-
-    patch_monitoring_store.log_start.assert_called_once_with(task_name)
+    mock_store.log_start.assert_called_once_with(task_name)
     assert result is None
-    assert "Error in log_monitoring_start_tool" in caplog.text
-    assert error_message in caplog.text
+    assert_logged(caplog, logging.ERROR, f"Failed to start monitoring log for task '{task_name}'")
 
 # --- Tests for log_monitoring_end_tool ---
 
-@pytest.mark.parametrize("status_to_test", [MonitoringStatus.SUCCESS, MonitoringStatus.FAILED, MonitoringStatus.PARTIAL_SUCCESS])
-def test_log_end_success(patch_monitoring_store: MagicMock, status_to_test: MonitoringStatus):
+@pytest.mark.parametrize("status, succeeded, failed, error_message", [
+    (MonitoringStatus.SUCCESS, 8, 0, None),
+    (MonitoringStatus.FAILED, 0, 2, "An error occurred"),
+    (MonitoringStatus.PARTIAL_SUCCESS, 8, 2, None),
+])
+def test_log_end_success(mock_store: MagicMock, status: MonitoringStatus, succeeded: int, failed: int, error_message):
     """작업 종료 로그 기록 성공 (다양한 상태) 및 True 반환 확인"""
-    patch_monitoring_store.log_end.return_value = True
-    log_id = 456
-    input_data = LogEndInput(
-        log_id=log_id,
-        status=status_to_test,
+    mock_store.log_end.return_value = True
+    expected_kwargs = dict(
+        log_id=456,
+        status=status,
         items_processed=10,
-        items_succeeded=8 if status_to_test != MonitoringStatus.FAILED else 0,
-        items_failed=2 if status_to_test != MonitoringStatus.SUCCESS else 0,
-        error_message="An error occurred" if status_to_test == MonitoringStatus.FAILED else None
+        items_succeeded=succeeded,
+        items_failed=failed,
+        error_message=error_message,
     )
 
-    result = log_monitoring_end_tool(input_data)
+    result = log_monitoring_end_tool(LogEndInput(**expected_kwargs))
 
-    patch_monitoring_store.log_end.assert_called_once_with(
-        log_id=log_id,
-        status=status_to_test,
-        items_processed=input_data.items_processed,
-        items_succeeded=input_data.items_succeeded,
-        items_failed=input_data.items_failed,
-        error_message=input_data.error_message,
-        details=None # 기본값 확인
-    )
+    mock_store.log_end.assert_called_once_with(**expected_kwargs, details=None) # details 기본값 확인
     assert result is True
 
-def test_log_end_repo_returns_false(patch_monitoring_store: MagicMock, caplog):
+def test_log_end_repo_returns_false(mock_store: MagicMock, caplog):
     """저장소 log_end가 False 반환 시 False 반환 및 로그 확인"""
-    patch_monitoring_store.log_end.return_value = False
+    mock_store.log_end.return_value = False
     log_id = 789
     input_data = LogEndInput(log_id=log_id, status=MonitoringStatus.SUCCESS)
 
     result = log_monitoring_end_tool(input_data)
 
-    patch_monitoring_store.log_end.assert_called_once() # 호출 인자 검증은 test_log_end_success에서
+    mock_store.log_end.assert_called_once() # 호출 인자 검증은 test_log_end_success에서
     assert result is False
-    assert f"Failed to end monitoring log for Log ID: {log_id}" in caplog.text
+    assert_logged(caplog, logging.WARNING, f"Failed to end monitoring log for Log ID: {log_id}")
 
-def test_log_end_repo_error(patch_monitoring_store: MagicMock, caplog):
-    """저장소 log_end에서 예외 발생 시 False 반환 및 로그 확인"""
-    error_message = "DB update error"
-    patch_monitoring_store.log_end.side_effect = Exception(error_message)
-    log_id = 101
-    input_data = LogEndInput(log_id=log_id, status=MonitoringStatus.FAILED, error_message="Task failed")
+# --- Repository error cases ---
 
-    result = log_monitoring_end_tool(input_data)
+@pytest.mark.parametrize("tool, method, input_data, sentinel, log_prefix", [
+    (log_monitoring_start_tool, "log_start", LogStartInput(task_name="error_start_task"), None, "Error in log_monitoring_start_tool"),
+    (log_monitoring_end_tool, "log_end", LogEndInput(log_id=101, status=MonitoringStatus.FAILED, error_message="Task failed"), False, "Error in log_monitoring_end_tool"),
+], ids=["log_start", "log_end"])
+def test_repo_error(mock_store: MagicMock, caplog, tool, method, input_data, sentinel, log_prefix):
+    """저장소에서 예외 발생 시 기본값(sentinel) 반환 및 로그 확인"""
+    getattr(mock_store, method).side_effect = Exception("boom")
 
-    patch_monitoring_store.log_end.assert_called_once()
-    assert result is False
-    assert "Error in log_monitoring_end_tool" in caplog.text
-    assert error_message in caplog.text
+    result = tool(input_data)
+
+    getattr(mock_store, method).assert_called_once()
+    assert result is sentinel
+    assert_logged(caplog, logging.ERROR, f"{log_prefix}: boom")
@@ -1,6 +1,7 @@
+import logging
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
-from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timezone, timedelta
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
@@ -15,6 +16,7 @@ from app.agents.tools.scheduler_tools import (
 )
 # Pydantic 모델 사용
 from pydantic import ValidationError
+from tests._assertions import assert_logged
 
 # --- Fixtures ---
 
@@ -22,15 +24,21 @@ from pydantic import ValidationError
 # autouse=True로 설정하면 모든 테스트 함수에 자동으로 적용됩니다.
 
 @pytest.fixture(autouse=True)
-def patch_scheduler_functions():
-    # 'app.agents.tools.scheduler_tools' 모듈 내에서 참조하는 함수들을 패치합니다.
-    with patch('app.agents.tools.scheduler_tools.add_job_to_scheduler', return_value="mock_job_id_123") as mock_add, \
-         patch('app.agents.tools.scheduler_tools.get_job_status') as mock_get, \
-         patch('app.agents.tools.scheduler_tools.list_all_jobs') as mock_list, \
-         patch('app.agents.tools.scheduler_tools.find_runnable') as mock_find: # find_runnable도 패치
-        # find_runnable은 기본적으로 모의 함수 객체를 반환하도록 설정
-        mock_find.return_value = AsyncMock() # 실제 함수가 아니므로 AsyncMock 등으로 대체
-        yield mock_add, mock_get, mock_list, mock_find
+def patch_scheduler_functions(monkeypatch):
+    # 'app.agents.tools.scheduler_tools' 모듈 내에서 참조하는 함수들을 모의 객체로 교체합니다.
+    mock_add = MagicMock(return_value="mock_job_id_123")
+    mock_get = MagicMock()
+    mock_list = MagicMock()
+    # find_runnable은 기본적으로 모의 함수 객체를 반환하도록 설정
+    mock_find = MagicMock(return_value=AsyncMock()) # 실제 함수가 아니므로 AsyncMock 등으로 대체
+    for name, mock in (
+        ("add_job_to_scheduler", mock_add),
+        ("get_job_status", mock_get),
+        ("list_all_jobs", mock_list),
+        ("find_runnable", mock_find),
+    ):
+        monkeypatch.setattr(f"app.agents.tools.scheduler_tools.{name}", mock)
+    return mock_add, mock_get, mock_list, mock_find
 
 @pytest.fixture
 def sample_job_status_dict():
@@ -42,9 +50,23 @@ def sample_job_status_dict():
         "trigger": "IntervalTrigger(seconds=60)"
     }
 
+# --- Helpers ---
+
+def assert_scheduled(mock_add, *, trigger_cls, trigger_attrs=None, **expected_kwargs):
+    """add_job_to_scheduler가 한 번 호출되었고, 트리거 타입/속성 및 키워드 인자가 기대값과 일치하는지 확인"""
+    mock_add.assert_called_once()
+    call_kwargs = mock_add.call_args.kwargs
+    # trigger가 키워드 인자로 전달되었는지 확인
+    assert 'trigger' in call_kwargs, "'trigger' not found in keyword arguments"
+    trigger_arg = call_kwargs['trigger']
+    assert isinstance(trigger_arg, trigger_cls), f"Expected {trigger_cls.__name__}, got {type(trigger_arg)}"
+    for attr, value in (trigger_attrs or {}).items():
+        assert getattr(trigger_arg, attr) == value, f"trigger.{attr}"
+    for key, value in expected_kwargs.items():
+        assert call_kwargs[key] == value, f"kwargs[{key!r}]"
+
 # --- Tests for schedule_collection_task_tool ---
 
-@pytest.mark.asyncio
 async def test_schedule_interval_job(patch_scheduler_functions):
     """Interval 트리거로 작업 추가 성공 및 job ID 반환 확인"""
     mock_add, _, _, mock_find = patch_scheduler_functions
@@ -58,24 +80,17 @@ async def test_schedule_interval_job(patch_scheduler_functions):
     result = await schedule_collection_task_tool(input_data)
 
     mock_find.assert_called_once_with("app.scheduler.tasks.collect_rss_feeds_task")
-    mock_add.assert_called_once()
-    # add_job_to_scheduler의 인자 확인
-    call_args = mock_add.call_args.args # 위치 인자 튜플
-    call_kwargs = mock_add.call_args.kwargs # 키워드 인자 사전
-
-    # trigger가 키워드 인자로 전달되었는지 확인
-    assert 'trigger' in call_kwargs, "'trigger' not found in keyword arguments"
-    trigger_arg = call_kwargs['trigger']
-    assert isinstance(trigger_arg, IntervalTrigger), f"Expected IntervalTrigger, got {type(trigger_arg)}"
-    assert trigger_arg.interval.total_seconds() == 300
-    # 나머지 키워드 인자 확인
-    assert call_kwargs['func'] == mock_find.return_value
-    assert call_kwargs['id'] is None # ID 미지정
-    assert call_kwargs['name'] == "app.scheduler.tasks.collect_rss_feeds_task" # 기본값
-    assert call_kwargs['replace_existing'] is False # 기본값
+    assert_scheduled(
+        mock_add,
+        trigger_cls=IntervalTrigger,
+        trigger_attrs={"interval": timedelta(seconds=300)},
+        func=mock_find.return_value,
+        id=None, # ID 미지정
+        name="app.scheduler.tasks.collect_rss_feeds_task", # 기본값
+        replace_existing=False, # 기본값
+    )
     assert result == {"job_id": "mock_job_id_123"}
 
-@pytest.mark.asyncio
 async def test_schedule_cron_job(patch_scheduler_functions):
     """Cron 트리거로 작업 추가 성공 확인"""
     mock_add, _, _, mock_find = patch_scheduler_functions
@@ -92,23 +107,33 @@ async def test_schedule_cron_job(patch_scheduler_functions):
     result = await schedule_collection_task_tool(input_data)
 
     mock_find.assert_called_once_with("another.task")
-    mock_add.assert_called_once()
-    # 인자 확인
-    call_args = mock_add.call_args.args
-    call_kwargs = mock_add.call_args.kwargs
-
-    # trigger가 키워드 인자로 전달되었는지 확인
-    assert 'trigger' in call_kwargs, "'trigger' not found in keyword arguments"
-    trigger_arg = call_kwargs['trigger']
-    assert isinstance(trigger_arg, CronTrigger), f"Expected CronTrigger, got {type(trigger_arg)}"
-    # 키워드 인자 확인
-    assert call_kwargs['func'] == mock_find.return_value
-    assert call_kwargs['id'] == "cron_job_test"
-    assert call_kwargs['name'] == "My Cron Job"
-    assert call_kwargs['replace_existing'] is True
+    assert_scheduled(
+        mock_add,
+        trigger_cls=CronTrigger,
+        func=mock_find.return_value,
+        id="cron_job_test",
+        name="My Cron Job",
+        replace_existing=True,
+    )
     assert result == {"job_id": "mock_job_id_123"}
 
-@pytest.mark.asyncio
+async def test_schedule_cron_job_reuses_trigger(patch_scheduler_functions):
+    """동일한 cron 인자로 두 번 등록 시 파싱된 CronTrigger를 재사용하는지 확인"""
+    mock_add, _, _, mock_find = patch_scheduler_functions
+    mock_find.return_value = print
+
+    input_data = ScheduleTaskInput(
+        function_path="another.task",
+        trigger_type="cron",
+        trigger_args={"hour": "6", "minute": "15"},
+    )
+    await schedule_collection_task_tool(input_data)
+    await schedule_collection_task_tool(input_data)
+
+    first_trigger, second_trigger = (c.kwargs['trigger'] for c in mock_add.call_args_list)
+    assert isinstance(first_trigger, CronTrigger)
+    assert first_trigger is second_trigger
+
 async def test_schedule_invalid_function_path(patch_scheduler_functions, caplog):
     """잘못된 함수 경로 입력 시 None 반환 및 오류 로깅 확인"""
     mock_add, _, _, mock_find = patch_scheduler_functions
@@ -126,10 +151,9 @@ async def test_schedule_invalid_function_path(patch_scheduler_functions, caplog)
     mock_add.assert_not_called() # add_job_to_scheduler 호출 안 됨
     assert result is None
     # 실제 로그 메시지 형식 확인 및 검증
-    assert "Failed to schedule job due to ImportError" in caplog.text
-    assert error_msg in caplog.text # 원래 예외 메시지 포함 확인
+    # 원래 예외 메시지 포함 확인
+    assert_logged(caplog, logging.ERROR, f"Failed to schedule job due to ImportError: {error_msg}")
 
-@pytest.mark.asyncio
 async def test_schedule_invalid_trigger_type(patch_scheduler_functions, caplog):
     """잘못된 트리거 타입 입력 시 None 반환 및 오류 로깅 확인"""
     mock_add, _, _, mock_find = patch_scheduler_functions
@@ -149,7 +173,6 @@ async def test_schedule_invalid_trigger_type(patch_scheduler_functions, caplog):
     # assert result is None
     # assert "Invalid trigger_type" in caplog.text
 
-@pytest.mark.asyncio
 async def test_schedule_scheduler_add_error(patch_scheduler_functions, caplog):
     """스케줄러 작업 추가 실패 시 None 반환 및 오류 로깅 확인"""
     mock_add, _, _, mock_find = patch_scheduler_functions
@@ -166,11 +189,10 @@ async def test_schedule_scheduler_add_error(patch_scheduler_functions, caplog):
     mock_find.assert_called_once()
     mock_add.assert_called_once() # 호출은 되었으나 실패
     assert result is None
-    assert "Failed to schedule job" in caplog.text
+    assert_logged(caplog, logging.ERROR, "Failed to schedule job")
 
 # --- Tests for check_task_status_tool ---
 
-@pytest.mark.asyncio
 async def test_check_existing_job(patch_scheduler_functions, sample_job_status_dict):
     """존재하는 job ID 조회 시 JobStatus 객체 반환 확인"""
     _, mock_get, _, _ = patch_scheduler_functions
@@ -188,7 +210,6 @@ async def test_check_existing_job(patch_scheduler_functions, sample_job_status_d
     assert isinstance(result.next_run_time, datetime)
     assert result.trigger == "IntervalTrigger(seconds=60)"
 
-@pytest.mark.asyncio
 async def test_check_nonexistent_job(patch_scheduler_functions, caplog):
     """존재하지 않는 job ID 조회 시 None 반환 확인"""
     _, mock_get, _, _ = patch_scheduler_functions
@@ -202,24 +223,8 @@ async def test_check_nonexistent_job(patch_scheduler_functions, caplog):
     assert result is None
     # 별도 로그는 남기지 않음 (정상 동작)
 
-@pytest.mark.asyncio
-async def test_check_job_scheduler_error(patch_scheduler_functions, caplog):
-    """스케줄러 조회 오류 발생 시 None 반환 및 로그 기록 확인"""
-    _, mock_get, _, _ = patch_scheduler_functions
-    mock_get.side_effect = Exception("Scheduler communication error")
-
-    input_data = CheckTaskInput(job_id="some_job")
-    result = await check_task_status_tool(input_data)
-
-    # 위치 인자로 호출 확인
-    mock_get.assert_called_once_with("some_job")
-    assert result is None
-    assert "Error checking job status for" in caplog.text
-    assert "Scheduler communication error" in caplog.text
-
 # --- Tests for list_scheduled_tasks_tool ---
 
-@pytest.mark.asyncio
 async def test_list_jobs_empty(patch_scheduler_functions):
     """스케줄된 작업 없을 때 빈 리스트 반환 확인"""
     _, _, mock_list, _ = patch_scheduler_functions
@@ -230,7 +235,6 @@ async def test_list_jobs_empty(patch_scheduler_functions):
     mock_list.assert_called_once_with()
     assert result == []
 
-@pytest.mark.asyncio
 async def test_list_jobs_multiple(patch_scheduler_functions, sample_job_status_dict):
     """여러 작업이 스케줄된 상태에서 올바른 목록 반환 확인"""
     _, _, mock_list, _ = patch_scheduler_functions
@@ -249,15 +253,20 @@ async def test_list_jobs_multiple(patch_scheduler_functions, sample_job_status_d
     assert isinstance(result[1], JobStatus)
     assert result[1].id == "another_job_2"
 
-@pytest.mark.asyncio
-async def test_list_jobs_scheduler_error(patch_scheduler_functions, caplog):
-    """스케줄러 목록 조회 오류 시 빈 리스트 반환 및 로그 기록 확인"""
-    _, _, mock_list, _ = patch_scheduler_functions
-    mock_list.side_effect = Exception("Failed to retrieve jobs")
+# --- Scheduler error cases ---
 
-    result = await list_scheduled_tasks_tool()
+@pytest.mark.parametrize("tool, mock_index, args, expected_call_args, sentinel, log_prefix", [
+    (check_task_status_tool, 1, (CheckTaskInput(job_id="some_job"),), ("some_job",), None, "Error checking job status for"),
+    (list_scheduled_tasks_tool, 2, (), (), [], "Error listing scheduled jobs"),
+], ids=["check_job", "list_jobs"])
+async def test_scheduler_error(patch_scheduler_functions, caplog, tool, mock_index, args, expected_call_args, sentinel, log_prefix):
+    """스케줄러 오류 발생 시 기본값(sentinel) 반환 및 로그 기록 확인"""
+    mock_func = patch_scheduler_functions[mock_index]
+    mock_func.side_effect = Exception("boom")
 
-    mock_list.assert_called_once_with()
-    assert result == []
-    assert "Error listing scheduled jobs" in caplog.text
-    assert "Failed to retrieve jobs" in caplog.text
+    result = await tool(*args)
+
+    mock_func.assert_called_once_with(*expected_call_args)
+    assert result == sentinel
+    assert_logged(caplog, logging.ERROR, log_prefix)
+    assert_logged(caplog, logging.ERROR, "boom")
@@ -0,0 +1,41 @@
+"""
+테스트 전역 공용 fixture
+"""
+import os
+import sys
+
+# app.config.DATABASE_URL은 app 모듈이 처음 임포트될 때 결정되고, app.scheduler는 임포트 시점에
+# 그 URL로 SQLAlchemyJobStore를 생성합니다. 루트 conftest는 모든 테스트 모듈보다 먼저 임포트되므로
+# 여기서 메모리 DB를 지정해 어떤 테스트 디렉토리를 먼저 수집하더라도 data/ 아래 DB 파일이 생성되지 않도록 합니다.
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+try:
+    import uvloop
+except ImportError: # 선택 의존성: 없으면 표준 asyncio 이벤트 루프 사용
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+    def pytest_asyncio_loop_factories(config, item):
+        """비동기 테스트/fixture 이벤트 루프를 uvloop로 생성 (await 스케줄링 오버헤드 감소, POSIX 전용)
+
+        pytest-asyncio 1.x에서 event_loop_policy fixture 재정의는 폐기 예정이므로 루프 팩토리 훅을 사용합니다.
+        uvloop가 없으면 훅을 정의하지 않아 기본 루프를 그대로 씁니다.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """ 세션 내 모든 테스트가 공유하는 FastAPI ASGI 테스트 클라이언트
+
+    앱 임포트(라우터/설정 로드) 비용이 크므로, 클라이언트가 필요한 테스트가 처음 실행될 때 한 번만 임포트합니다.
+    """
+    from app.main import app
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
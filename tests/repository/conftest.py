@@ -0,0 +1,81 @@
+"""
+저장소 테스트 공용 DB fixture
+
+세션 전체에서 인메모리 엔진 하나를 공유하고, 각 테스트는 바깥 트랜잭션 안에서 실행한 뒤
+종료 시 롤백하여 격리합니다. 저장소 코드의 commit()은 SAVEPOINT 해제로 처리됩니다.
+"""
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models.db_models import Base
+
+# 대량 데이터 성능 측정 스크립트(perf_*)는 pytest 수집 대상이 아닌 별도 실행용
+collect_ignore_glob = ["*perf_*"]
+
+# 테이블 목록과 누수 검사 쿼리를 모듈 로드 시 한 번만 만들어 테스트마다 재계산하지 않음
+# (테이블별 행 수를 스칼라 서브쿼리로 묶어 한 번의 SELECT로 조회)
+_TABLES = tuple(Base.metadata.sorted_tables)
+# 스키마 DDL(CREATE TABLE/INDEX)도 SQLite 방언으로 한 번만 컴파일해 문자열로 보관
+_SCHEMA_DDL = tuple(
+    str(ddl.compile(dialect=sqlite.dialect())).strip()
+    for t in _TABLES
+    for ddl in (CreateTable(t), *(CreateIndex(index) for index in t.indexes))
+)
+_LEAK_CHECK = select(*(select(func.count()).select_from(t).scalar_subquery().label(t.name) for t in _TABLES))
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """스키마가 생성된 세션 공유 인메모리 엔진 (세션당 한 번만 스키마 생성)"""
+    # StaticPool: 모든 세션이 동일한 단일 커넥션을 공유하므로 인메모리 스키마/데이터가 유지됨
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        # 테스트 DB는 내구성이 필요 없으므로 fsync/디스크 저널을 끔 (인메모리 DB에 맞는 PRAGMA만 사용)
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        # pysqlite 드라이버의 암묵적 트랜잭션 처리를 끄고 SQLAlchemy가 BEGIN을 직접 발행하도록 설정
+        # (SAVEPOINT 기반 테스트 격리에 필요)
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # create_all의 테이블 존재 확인/DDL 컴파일 없이 미리 컴파일한 DDL을 그대로 실행
+    with engine.begin() as conn:
+        for ddl in _SCHEMA_DDL:
+            conn.exec_driver_sql(ddl)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_engine):
+    """테스트마다 바깥 트랜잭션을 열고, 그 커넥션에 바인딩된 세션 팩토리를 제공 (종료 시 롤백)"""
+    connection = db_engine.connect()
+    trans = connection.begin()
+    # create_savepoint: 세션의 commit/rollback이 바깥 트랜잭션이 아닌 SAVEPOINT에만 적용됨
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
+
+    yield connection, SessionLocal
+
+    trans.rollback()
+    # 롤백 후에도 행이 남아 있다면 바깥 트랜잭션을 벗어난 커밋이 있었던 것 (테스트 간 누수)
+    leaked = {name: count for name, count in connection.execute(_LEAK_CHECK).one()._mapping.items() if count}
+    assert not leaked, f"rows leaked after rollback: {leaked}"
+    connection.close()
@@ -1,61 +1,17 @@
 import pytest
-import os
-import uuid
-from datetime import datetime, timezone
-from typing import Generator
-from pathlib import Path
-
-from sqlalchemy import create_engine, inspect as sqlalchemy_inspect
-from sqlalchemy.orm import sessionmaker, Session
 
 from app.repository.monitoring_store import SQLiteMonitoringRepository
-from app.models.db_models import Base, MonitoringLogDB
+from app.models.db_models import MonitoringLogDB
 from app.models.enums import MonitoringStatus
-from app.config import BASE_DIR
 
 # --- Test Setup (Reusing concepts from test_sqlite_store) ---
 
-# 임시 테스트 데이터베이스 경로 설정
-TEST_DB_DIR = BASE_DIR / "tests" / "temp_data"
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_db_directory():
-    """테스트 시작 전 임시 데이터 디렉토리 생성"""
-    TEST_DB_DIR.mkdir(parents=True, exist_ok=True)
-    yield
-
-@pytest.fixture(scope="function")
-def db_engine_session():
-    """각 테스트 함수마다 독립적인 DB 엔진과 세션 생성"""
-    db_path = TEST_DB_DIR / f"test_monitoring_db_{uuid.uuid4()}.db"
-    test_db_url = f"sqlite:///{db_path}"
-    
-    engine = create_engine(test_db_url, connect_args={"check_same_thread": False})
-    # Base에 MonitoringLogDB가 포함되어 있으므로 모든 테이블 생성
-    Base.metadata.create_all(bind=engine) 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    yield engine, SessionLocal
-
-    # 테스트 함수 종료 후 DB 파일 삭제
-    if db_path.exists():
-        os.remove(db_path)
-
 @pytest.fixture(scope="function")
-def monitoring_repo(db_engine_session) -> SQLiteMonitoringRepository:
+def monitoring_repo(db_engine, db_session) -> SQLiteMonitoringRepository:
     """각 테스트 함수를 위한 SQLiteMonitoringRepository 인스턴스 생성"""
-    engine, SessionLocal = db_engine_session
-    
-    repo = SQLiteMonitoringRepository(db_url=str(engine.url))
-    repo.engine = engine
-    repo.SessionLocal = SessionLocal
-    
-    # 테이블 비우기 (각 테스트 시작 시)
-    with repo.get_db() as db:
-        db.query(MonitoringLogDB).delete()
-        db.commit()
-        
-    return repo
+    _, SessionLocal = db_session
+    # 테스트 종료 시 db_session이 바깥 트랜잭션을 롤백하므로 별도 정리 불필요
+    return SQLiteMonitoringRepository.from_engine(db_engine, SessionLocal)
 
 # --- Test Cases ---
 
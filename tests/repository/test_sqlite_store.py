@@ -1,108 +1,63 @@
 import pytest
-import asyncio
-import os
 import uuid
 from datetime import datetime, timezone
-from typing import List, Generator
-from pathlib import Path
+from typing import List
 
-from sqlalchemy import create_engine, inspect, func
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
 
 from app.models.collected_data import CollectedData
 from app.models.enums import SourceType, ProcessingStatus
 from app.repository.sqlite_store import SQLiteRepository
-from app.models.db_models import Base, CollectedDataDB
-from app.config import BASE_DIR
+from app.models.db_models import CollectedDataDB
 
 # --- Test Setup ---
 
-# 임시 테스트 데이터베이스 경로 설정
-TEST_DB_DIR = BASE_DIR / "tests" / "temp_data"
-TEST_DB_URL = f"sqlite:///{TEST_DB_DIR}/test_collected_news.db"
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_db_directory():
-    """테스트 시작 전 임시 데이터 디렉토리 생성"""
-    TEST_DB_DIR.mkdir(parents=True, exist_ok=True)
-    yield
-    # 세션 종료 후 임시 디렉토리 정리 (선택 사항)
-    # import shutil
-    # shutil.rmtree(TEST_DB_DIR)
-
-@pytest.fixture(scope="function")
-def db_engine_session():
-    """각 테스트 함수마다 독립적인 DB 엔진과 세션 생성"""
-    # 각 테스트마다 고유한 DB 파일 사용 (또는 메모리 DB :memory:)
-    # 여기서는 파일을 사용하되, 각 테스트 함수 전에 초기화
-    db_path = TEST_DB_DIR / f"test_db_{uuid.uuid4()}.db"
-    test_db_url = f"sqlite:///{db_path}"
-    
-    engine = create_engine(test_db_url, connect_args={"check_same_thread": False})
-    Base.metadata.create_all(bind=engine) # 테이블 생성
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    yield engine, SessionLocal # 테스트 함수에 엔진과 세션 팩토리 제공
-
-    # 테스트 함수 종료 후 DB 파일 삭제
-    if db_path.exists():
-        os.remove(db_path)
-
 @pytest.fixture(scope="function")
-def sqlite_repo(db_engine_session) -> SQLiteRepository:
+def sqlite_repo(db_engine, db_session) -> SQLiteRepository:
     """각 테스트 함수를 위한 SQLiteRepository 인스턴스 생성"""
-    engine, SessionLocal = db_engine_session
-    
-    # 실제 Repository 생성 시 engine 정보를 직접 전달할 수 있도록 수정 필요
-    # 임시 방편: Repository 내부에서 사용하는 URL을 테스트용 URL로 설정
-    repo = SQLiteRepository(db_url=str(engine.url)) 
-    repo.engine = engine # 내부 엔진 교체
-    repo.SessionLocal = SessionLocal # 내부 세션 팩토리 교체
-    
-    # 테이블 비우기 (각 테스트 시작 시)
-    with repo.get_db() as db:
-        # 모든 테이블 데이터 삭제 (더 안전한 방법)
-        for table in reversed(Base.metadata.sorted_tables):
-             db.execute(table.delete())
-        db.commit()
-        
-    return repo
-
-@pytest.fixture
-def sample_data() -> CollectedData:
-    """테스트용 샘플 데이터 생성"""
-    return CollectedData(
-        id=str(uuid.uuid4()),
-        source_url="http://example.com/news/1",
-        source_type=SourceType.RSS,
-        collected_at=datetime.now(timezone.utc),
-        title="Test News Title 1",
-        link="http://example.com/news/1",
-        published_at=datetime.now(timezone.utc),
-        summary="Test summary 1",
-        content="Test content 1",
-        author="Test Author 1",
-        categories=["AI", "Test"],
-        tags=["testing", "sqlite"],
-        relevance_score=0.9,
-        processing_status=ProcessingStatus.PENDING,
-        extra_data={"key": "value1"}
-    )
-
-@pytest.fixture
-def sample_data_list(sample_data) -> List[CollectedData]:
-    """테스트용 샘플 데이터 리스트 생성"""
-    data_list = [sample_data]
+    _, SessionLocal = db_session
+    # 세션 공유 엔진과 테스트 트랜잭션에 바인딩된 세션 팩토리를 그대로 주입 (엔진 생성/테이블 확인 생략)
+    # 테스트 종료 시 db_session이 바깥 트랜잭션을 롤백하므로 별도 정리 불필요
+    return SQLiteRepository.from_engine(db_engine, SessionLocal)
+
+def _sample_id(index: int) -> str:
+    """인덱스에서 유도한 고정 UUID 문자열 (테스트 간 격리는 트랜잭션 롤백으로 보장)"""
+    return str(uuid.UUID(int=index))
+
+@pytest.fixture(scope="session")
+def _sample_data_list_template() -> List[CollectedData]:
+    """샘플 데이터 원본 목록 (세션당 한 번만 생성/검증)"""
+    now = datetime.now(timezone.utc)
+    data_list = [
+        CollectedData(
+            id=_sample_id(1),
+            source_url="http://example.com/news/1",
+            source_type=SourceType.RSS,
+            collected_at=now,
+            title="Test News Title 1",
+            link="http://example.com/news/1",
+            published_at=now,
+            summary="Test summary 1",
+            content="Test content 1",
+            author="Test Author 1",
+            categories=["AI", "Test"],
+            tags=["testing", "sqlite"],
+            relevance_score=0.9,
+            processing_status=ProcessingStatus.PENDING,
+            extra_data={"key": "value1"}
+        )
+    ]
     for i in range(2, 5):
         data_list.append(
             CollectedData(
-                id=str(uuid.uuid4()),
+                id=_sample_id(i),
                 source_url=f"http://example.com/news/{i}",
                 source_type=SourceType.CRAWLING,
-                collected_at=datetime.now(timezone.utc),
+                collected_at=now,
                 title=f"Test News Title {i}",
                 link=f"http://example.com/news/{i}",
-                published_at=datetime.now(timezone.utc),
+                published_at=now,
                 summary=f"Test summary {i}",
                 content=f"Test content {i}",
                 author=f"Test Author {i}",
@@ -115,9 +70,62 @@ def sample_data_list(sample_data) -> List[CollectedData]:
         )
     return data_list
 
+@pytest.fixture
+def sample_data_list(_sample_data_list_template) -> List[CollectedData]:
+    """테스트용 샘플 데이터 리스트 (원본의 깊은 복사본)"""
+    return [d.model_copy(deep=True) for d in _sample_data_list_template]
+
+@pytest.fixture
+def sample_data(sample_data_list) -> CollectedData:
+    """테스트용 샘플 데이터 (sample_data_list의 첫 번째 항목)"""
+    return sample_data_list[0]
+
+def _count(repo: SQLiteRepository, predicate=None) -> int:
+    """collected_data 행 수를 SELECT COUNT(*) 한 번으로 조회 (predicate가 있으면 WHERE 적용)"""
+    stmt = select(func.count()).select_from(CollectedDataDB)
+    if predicate is not None:
+        stmt = stmt.where(predicate)
+    with repo.get_db() as db:
+        return db.execute(stmt).scalar_one()
+
+# --- 테스트별 보조 데이터 (저장소가 변경하지 않으므로 모듈 상수로 한 번만 생성/검증) ---
+
+# sample_data와 제목이 같고 ID가 다른 데이터
+DUPLICATE_TITLE_DATA = CollectedData(
+    id=_sample_id(101), # 다른 ID
+    source_url="http://example.com/news/dup",
+    source_type=SourceType.RSS,
+    collected_at=datetime.now(timezone.utc),
+    title="Test News Title 1", # sample_data와 동일 제목
+    link="http://example.com/news/dup",
+    published_at=datetime.now(timezone.utc),
+    summary="Duplicate summary",
+    content="Duplicate content",
+    author="Duplicate Author",
+    categories=["Dup"],
+    tags=["duplicate"],
+    relevance_score=0.5,
+    processing_status=ProcessingStatus.PENDING,
+    extra_data={}
+)
+
+# sample_data와 제목이 유사한 데이터 (processing_status 기본값 사용)
+SIMILAR_TITLE_DATA = CollectedData(
+    id=_sample_id(102),
+    title="Test News Title 1 slightly modified", # 유사 제목
+    source_url="http://example.com/news/sim",
+    source_type=SourceType.RSS,
+    collected_at=datetime.now(timezone.utc),
+    link="http://example.com/news/sim",
+    published_at=datetime.now(timezone.utc),
+    summary="Similar summary", content="Similar content", author="Similar Author",
+)
+
+# 제목 없는 데이터
+NO_TITLE_DATA = CollectedData(id=_sample_id(100), title=None, source_url="http://notitle.com", source_type=SourceType.UNKNOWN)
+
 # --- Test Cases ---
 
-@pytest.mark.asyncio
 async def test_save_data_success(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """데이터 저장 성공 테스트"""
     saved_data = await sqlite_repo.save_data(sample_data)
@@ -133,7 +141,6 @@ async def test_save_data_success(sqlite_repo: SQLiteRepository, sample_data: Col
         assert db_item is not None
         assert db_item.title == sample_data.title
 
-@pytest.mark.asyncio
 async def test_save_data_duplicate_id(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """중복 ID 저장 시도 테스트 (IntegrityError 발생 및 None 반환 확인)"""
     # 첫 번째 저장
@@ -141,9 +148,6 @@ async def test_save_data_duplicate_id(sqlite_repo: SQLiteRepository, sample_data
     assert first_saved is not None
     assert first_saved.id == sample_data.id
 
-    # DB 쓰기 반영을 위한 짧은 지연 (혹시 모르니 유지)
-    await asyncio.sleep(0.01)
-
     # 동일 ID로 다시 저장 시도 -> IntegrityError 발생 후 None 반환 예상
     saved_again = await sqlite_repo.save_data(sample_data)
 
@@ -160,73 +164,33 @@ async def test_save_data_duplicate_id(sqlite_repo: SQLiteRepository, sample_data
     assert final_data.title == sample_data.title # 내용 동일성 체크
 
     # 3. 최종 상태 검증: DB에 실제로 하나만 있는지 확인
-    with sqlite_repo.get_db() as db:
-        count = db.query(func.count(CollectedDataDB.id)).filter(CollectedDataDB.id == sample_data.id).scalar()
-        assert count == 1, "Database should contain only one entry for the duplicate ID."
+    assert _count(sqlite_repo, CollectedDataDB.id == sample_data.id) == 1, "Database should contain only one entry for the duplicate ID."
 
-@pytest.mark.asyncio
 async def test_save_data_duplicate_title(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """중복 제목 저장 시도 테스트"""
     await sqlite_repo.save_data(sample_data) # 원본 저장
     
-    duplicate_title_data = CollectedData(
-        id=str(uuid.uuid4()), # 다른 ID
-        source_url="http://example.com/news/dup",
-        source_type=SourceType.RSS,
-        collected_at=datetime.now(timezone.utc),
-        title=sample_data.title, # 동일 제목
-        link="http://example.com/news/dup",
-        published_at=datetime.now(timezone.utc),
-        summary="Duplicate summary",
-        content="Duplicate content",
-        author="Duplicate Author",
-        categories=["Dup"],
-        tags=["duplicate"],
-        relevance_score=0.5,
-        processing_status=ProcessingStatus.PENDING,
-        extra_data={}
-    )
-    
-    saved_duplicate = await sqlite_repo.save_data(duplicate_title_data, check_duplicates=True, similarity_threshold=0.95)
+    saved_duplicate = await sqlite_repo.save_data(DUPLICATE_TITLE_DATA, check_duplicates=True, similarity_threshold=0.95)
     
     # 중복 제목은 저장되지 않아야 함 (None 반환)
     assert saved_duplicate is None
     
     # DB에 원본만 있는지 확인
-    with sqlite_repo.get_db() as db:
-        count = db.query(func.count(CollectedDataDB.id)).filter(CollectedDataDB.title == sample_data.title).scalar()
-        assert count == 1
+    assert _count(sqlite_repo, CollectedDataDB.title == sample_data.title) == 1
 
-@pytest.mark.asyncio
 async def test_save_data_similar_title_below_threshold(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """유사 제목 저장 (임계값 이하)"""
     await sqlite_repo.save_data(sample_data) 
     
-    similar_title_data = CollectedData(
-        id=str(uuid.uuid4()),
-        title="Test News Title 1 slightly modified", # 유사 제목
-        # ... (other fields similar to sample_data) ...
-         source_url="http://example.com/news/sim",
-        source_type=SourceType.RSS,
-        collected_at=datetime.now(timezone.utc),
-        link="http://example.com/news/sim",
-        published_at=datetime.now(timezone.utc),
-        summary="Similar summary", content="Similar content", author="Similar Author",
-        # processing_status 기본값(RAW) 사용
-    )
-
-    saved_similar = await sqlite_repo.save_data(similar_title_data, check_duplicates=True, similarity_threshold=0.9) # 높은 임계값
+    saved_similar = await sqlite_repo.save_data(SIMILAR_TITLE_DATA, check_duplicates=True, similarity_threshold=0.9) # 높은 임계값
     
     # 임계값보다 유사도가 낮으므로 저장되어야 함
     assert saved_similar is not None
-    assert saved_similar.id == similar_title_data.id
+    assert saved_similar.id == SIMILAR_TITLE_DATA.id
     
     # DB에 2개 있는지 확인
-    with sqlite_repo.get_db() as db:
-        count = db.query(func.count(CollectedDataDB.id)).scalar()
-        assert count == 2
+    assert _count(sqlite_repo) == 2
 
-@pytest.mark.asyncio
 async def test_get_data_by_id(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """ID로 데이터 조회 테스트"""
     await sqlite_repo.save_data(sample_data)
@@ -237,17 +201,14 @@ async def test_get_data_by_id(sqlite_repo: SQLiteRepository, sample_data: Collec
     assert retrieved_data.id == sample_data.id
     assert retrieved_data.title == sample_data.title
 
-@pytest.mark.asyncio
 async def test_get_data_by_id_not_found(sqlite_repo: SQLiteRepository):
     """존재하지 않는 ID 조회 테스트"""
     retrieved_data = await sqlite_repo.get_data_by_id("non_existent_id")
     assert retrieved_data is None
 
-@pytest.mark.asyncio
 async def test_get_all_data(sqlite_repo: SQLiteRepository, sample_data_list: List[CollectedData]):
     """모든 데이터 조회 테스트 (페이지네이션 포함)"""
-    for data in sample_data_list:
-        await sqlite_repo.save_data(data, check_duplicates=False) # 중복 체크 없이 저장
+    await sqlite_repo.save_bulk_data(sample_data_list) # 중복 체크 없이 단일 트랜잭션으로 저장
         
     all_data = await sqlite_repo.get_all_data(limit=100, skip=0)
     assert len(all_data) == len(sample_data_list)
@@ -261,11 +222,9 @@ async def test_get_all_data(sqlite_repo: SQLiteRepository, sample_data_list: Lis
     assert len(page2) == len(sample_data_list) - 2
     assert page1[0].id != page2[0].id # 페이지 내용 다른지 확인 (정렬 순서 따라 달라질 수 있음)
 
-@pytest.mark.asyncio
 async def test_find_data(sqlite_repo: SQLiteRepository, sample_data_list: List[CollectedData]):
     """조건 검색 테스트"""
-    for data in sample_data_list:
-        await sqlite_repo.save_data(data, check_duplicates=False)
+    await sqlite_repo.save_bulk_data(sample_data_list)
         
     # SourceType으로 검색
     rss_data = await sqlite_repo.find_data({"source_type": SourceType.RSS})
@@ -280,7 +239,6 @@ async def test_find_data(sqlite_repo: SQLiteRepository, sample_data_list: List[C
     not_found = await sqlite_repo.find_data({"author": "Non Existent Author"})
     assert len(not_found) == 0
 
-@pytest.mark.asyncio
 async def test_update_data(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """데이터 업데이트 테스트"""
     await sqlite_repo.save_data(sample_data)
@@ -305,13 +263,11 @@ async def test_update_data(sqlite_repo: SQLiteRepository, sample_data: Collected
     assert retrieved.title == "Updated Test Title"
     assert retrieved.processing_status == ProcessingStatus.ANALYZED # DB 확인 시에도 변경된 값 확인
 
-@pytest.mark.asyncio
 async def test_update_data_not_found(sqlite_repo: SQLiteRepository):
     """존재하지 않는 데이터 업데이트 시도"""
     updated_data = await sqlite_repo.update_data("non_existent_id", {"title": "New Title"})
     assert updated_data is None
 
-@pytest.mark.asyncio
 async def test_delete_data(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """데이터 삭제 테스트"""
     await sqlite_repo.save_data(sample_data)
@@ -324,21 +280,36 @@ async def test_delete_data(sqlite_repo: SQLiteRepository, sample_data: Collected
     assert retrieved is None
     
     # DB 직접 확인
-    with sqlite_repo.get_db() as db:
-        count = db.query(func.count(CollectedDataDB.id)).filter(CollectedDataDB.id == sample_data.id).scalar()
-        assert count == 0
+    assert _count(sqlite_repo, CollectedDataDB.id == sample_data.id) == 0
 
-@pytest.mark.asyncio
 async def test_delete_data_not_found(sqlite_repo: SQLiteRepository):
     """존재하지 않는 데이터 삭제 시도"""
     delete_result = await sqlite_repo.delete_data("non_existent_id")
     assert delete_result is False
 
-@pytest.mark.asyncio
-async def test_save_bulk_data(sqlite_repo: SQLiteRepository, sample_data_list: List[CollectedData]):
-    """벌크 데이터 저장 테스트"""
-    saved_list = await sqlite_repo.save_bulk_data(sample_data_list)
-    
+async def test_save_bulk_data(sqlite_repo: SQLiteRepository, sample_data_list: List[CollectedData], db_session, monkeypatch):
+    """벌크 데이터 저장 테스트 (단일 트랜잭션, 단일 INSERT 문으로 저장되는지 포함)"""
+    connection, _ = db_session
+    commits = []
+    original_commit = Session.commit
+    def counting_commit(self):
+        commits.append(self)
+        return original_commit(self)
+    monkeypatch.setattr(Session, "commit", counting_commit)
+    inserts = []
+    def record_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO collected_data"):
+            inserts.append(statement)
+    event.listen(connection, "before_cursor_execute", record_insert)
+
+    try:
+        saved_list = await sqlite_repo.save_bulk_data(sample_data_list)
+    finally:
+        event.remove(connection, "before_cursor_execute", record_insert)
+
+    assert len(commits) == 1
+    assert len(inserts) == 1
+
     assert len(saved_list) == len(sample_data_list)
     assert all(isinstance(d, CollectedData) for d in saved_list)
     
@@ -351,7 +322,6 @@ async def test_save_bulk_data(sqlite_repo: SQLiteRepository, sample_data_list: L
     expected_ids = {d.id for d in sample_data_list}
     assert saved_ids == expected_ids
 
-@pytest.mark.asyncio
 async def test_check_title_exists(sqlite_repo: SQLiteRepository, sample_data: CollectedData):
     """제목 존재 여부 확인 테스트"""
     await sqlite_repo.save_data(sample_data)
@@ -371,12 +341,10 @@ async def test_check_title_exists(sqlite_repo: SQLiteRepository, sample_data: Co
     assert exists_different is False
     
     # 제목 없는 데이터 저장 후 체크
-    no_title_data = CollectedData(id=str(uuid.uuid4()), title=None, source_url="http://notitle.com", source_type=SourceType.UNKNOWN) # source_type 추가
-    await sqlite_repo.save_data(no_title_data, check_duplicates=False)
+    await sqlite_repo.save_data(NO_TITLE_DATA, check_duplicates=False)
     exists_after_no_title = await sqlite_repo.check_title_exists(sample_data.title)
     assert exists_after_no_title is True # 제목 없는 데이터는 체크에 영향 안 줌
 
-@pytest.mark.asyncio
 async def test_empty_database(sqlite_repo: SQLiteRepository):
     """빈 데이터베이스 초기 상태 테스트"""
     all_data = await sqlite_repo.get_all_data()
@@ -387,9 +355,3 @@ async def test_empty_database(sqlite_repo: SQLiteRepository):
     
     exists = await sqlite_repo.check_title_exists("Any Title")
     assert exists is False
-
-# --- 추가 테스트 케이스 (필요시) ---
-# - Null 값 필드 처리 테스트
-# - 특수 문자 포함 데이터 처리 테스트
-# - 대량 데이터 처리 시 성능 테스트 (별도 스크립트)
-# - 동시성 테스트 (여러 요청 처리) 
\ No newline at end of file
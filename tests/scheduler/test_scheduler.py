@@ -1 +1,119 @@
+import logging
+import pytest
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from apscheduler.triggers.interval import IntervalTrigger
 
+from app.scheduler import scheduler as scheduler_module
+from app.scheduler.scheduler import add_job_to_scheduler, start_scheduler, shutdown_scheduler
+from tests._assertions import assert_logged
+
+# 이 모듈은 전역 scheduler 싱글톤을 패치하므로 --dist loadgroup 실행 시에도 한 워커에서 실행되도록 묶음
+# (기본 설정인 --dist loadfile에서는 모듈 단위로 분배되므로 자동으로 보장됨)
+pytestmark = pytest.mark.xdist_group("scheduler_singleton")
+
+# --- Fixtures ---
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_add_job():
+    """전역 scheduler.add_job을 모듈 단위로 한 번만 패치 (테스트마다 patch 진입/해제 반복 방지)"""
+    patcher = patch.object(scheduler_module.scheduler, "add_job")
+    mock = patcher.start()
+    yield mock
+    patcher.stop()
+
+@pytest.fixture
+def mock_scheduler(_patched_add_job) -> MagicMock:
+    """모듈 공유 add_job 모의 객체를 테스트마다 초기화해 반환"""
+    _patched_add_job.reset_mock(return_value=True, side_effect=True)
+    return _patched_add_job
+
+@pytest.fixture
+def mock_sched():
+    """전역 scheduler 객체 전체를 모의 객체로 교체 (시작/종료 테스트용, 테스트당 한 번만 패치)"""
+    with patch.object(scheduler_module, "scheduler") as mock:
+        yield mock
+
+@pytest.fixture
+def mock_logger():
+    """scheduler 모듈의 logger 객체 전체를 한 번에 패치 (info/error 등 메서드별 패치 불필요)"""
+    with patch.object(scheduler_module, "logger") as mock:
+        yield mock
+
+def sample_task():
+    """스케줄 대상 더미 작업"""
+
+# --- Tests for add_job_to_scheduler ---
+
+def test_add_job_returns_job_id(mock_scheduler: MagicMock):
+    """작업 추가 성공 시 인자 전달 및 job ID 반환 확인"""
+    mock_scheduler.return_value = MagicMock(id="job_1")
+    trigger = IntervalTrigger(minutes=60)
+
+    result = add_job_to_scheduler(sample_task, trigger, id="job_1", replace_existing=True)
+
+    mock_scheduler.assert_called_once_with(sample_task, trigger, id="job_1", replace_existing=True)
+    assert result == "job_1"
+
+@pytest.mark.parametrize("trigger_args, expected_interval, job_id", [
+    ({"minutes": 30}, timedelta(minutes=30), "crawl_test_site_30"),
+    ({"hours": 1}, timedelta(minutes=60), "crawl_test_site_default"),
+    ({"minutes": 120}, timedelta(hours=2), "crawl_test_site_120"),
+], ids=["30min", "default", "120min"])
+def test_add_job_sets_correct_interval(mock_scheduler: MagicMock, trigger_args, expected_interval, job_id):
+    """Interval 트리거의 간격과 job ID가 그대로 스케줄러에 전달되는지 확인"""
+    mock_scheduler.return_value = MagicMock(id=job_id)
+
+    add_job_to_scheduler(sample_task, IntervalTrigger(**trigger_args), id=job_id)
+
+    assert mock_scheduler.call_args.args[1].interval == expected_interval
+    assert mock_scheduler.call_args.kwargs["id"] == job_id
+
+def test_add_job_error(mock_scheduler: MagicMock, caplog):
+    """스케줄러 add_job 예외 발생 시 None 반환 및 오류 로그 확인"""
+    mock_scheduler.side_effect = Exception("boom")
+
+    result = add_job_to_scheduler(sample_task, IntervalTrigger(minutes=60), id="broken_job")
+
+    assert result is None
+    assert_logged(caplog, logging.ERROR, "Failed to add job broken_job: boom")
+
+# --- Tests for start_scheduler / shutdown_scheduler ---
+
+@pytest.mark.parametrize("running, should_start, expected_log", [
+    (False, True, "Scheduler started."),
+    (True, False, "Scheduler is already running."),
+], ids=["stopped", "running"])
+def test_start_scheduler(mock_sched: MagicMock, mock_logger: MagicMock, running: bool, should_start: bool, expected_log: str):
+    """실행 중이 아닐 때만 scheduler.start가 호출되는지 확인"""
+    mock_sched.running = running
+
+    start_scheduler()
+
+    assert mock_sched.start.called is should_start
+    mock_logger.info.assert_called_once_with(expected_log)
+    mock_logger.error.assert_not_called()
+
+@pytest.mark.parametrize("running, should_shutdown", [(True, True), (False, False)], ids=["running", "stopped"])
+def test_shutdown_scheduler(mock_sched: MagicMock, mock_logger: MagicMock, running: bool, should_shutdown: bool):
+    """실행 중일 때만 scheduler.shutdown이 호출되는지 확인"""
+    mock_sched.running = running
+
+    shutdown_scheduler()
+
+    assert mock_sched.shutdown.called is should_shutdown
+    assert mock_logger.info.called is should_shutdown # 실행 중이 아니면 아무 로그도 남기지 않음
+    mock_logger.error.assert_not_called()
+
+@pytest.mark.parametrize("func, method, expected_log", [
+    (start_scheduler, "start", "Failed to start scheduler: boom"),
+    (shutdown_scheduler, "shutdown", "Failed to shut down scheduler: boom"),
+], ids=["start", "shutdown"])
+def test_scheduler_lifecycle_error(mock_sched: MagicMock, mock_logger: MagicMock, func, method, expected_log):
+    """scheduler.start/shutdown 예외 발생 시 오류 로그만 남기고 예외를 전파하지 않는지 확인"""
+    mock_sched.running = method == "shutdown"
+    getattr(mock_sched, method).side_effect = Exception("boom")
+
+    func()
+
+    mock_logger.error.assert_called_once_with(expected_log, exc_info=True)
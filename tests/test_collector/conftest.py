@@ -0,0 +1,95 @@
+"""
+RSS 수집기 테스트 공용 fixture
+
+수집기 인스턴스와 피드 소스 목록은 테스트에서 변경되지 않으므로 모듈당 한 번만 생성하고,
+FeedItem 샘플은 pydantic 검증 비용이 있으므로 세션당 한 번만 생성합니다.
+"""
+from datetime import datetime, timezone
+from unittest.mock import create_autospec
+
+import pytest
+
+from app.collector.rss_collector import RSSCollector
+from app.models.schemas import FeedItem
+
+# 고정 발행 시각 (UTC, datetime.now() 대신 사용해 fixture 결과가 결정적이도록 함)
+FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def test_sources():
+    """테스트용 피드 소스 목록"""
+    return [
+        {
+            "name": "Test Feed 1",
+            "url": "https://example.com/feed1.xml",
+            "category": "Technology",
+            "priority": 1, # 예시 우선순위
+            "update_interval": 12 # 예시 업데이트 주기
+        },
+        {
+            "name": "Test Feed 2",
+            "url": "https://example.com/feed2.xml",
+            "category": "AI Research",
+            "priority": 2,
+            "update_interval": 24
+        }
+    ]
+
+
+@pytest.fixture(scope="module")
+def collector(test_sources):
+    """테스트 소스로 초기화한 RSSCollector (timeout 10초)"""
+    return RSSCollector(feed_sources=test_sources, timeout=10)
+
+
+@pytest.fixture(scope="session")
+def _autospec_collector():
+    """RSSCollector 인스턴스 autospec 모의 객체 (시그니처 검사 비용이 크므로 세션당 한 번만 생성)"""
+    return create_autospec(RSSCollector, instance=True)
+
+
+@pytest.fixture
+def mock_collector(_autospec_collector):
+    """세션 공유 autospec 모의 객체를 테스트마다 초기화해 반환
+
+    copy.copy()는 자식 모의 객체(_mock_children)를 공유하므로 호출 기록이 테스트 간에 섞입니다.
+    대신 reset_mock으로 호출 기록과 반환값/side_effect를 초기화합니다.
+    """
+    _autospec_collector.reset_mock(return_value=True, side_effect=True)
+    return _autospec_collector
+
+
+# --- FeedItem fixtures (세션당 한 번만 생성/검증, 변경이 필요하면 model_copy() 사용) ---
+
+@pytest.fixture(scope="session")
+def item1():
+    return FeedItem(id="1", title="A1", link="http://a.com/1", published=FIXED_TS, source_name="S1", source_url="http://example.com/s1.xml", source_category="C1")
+
+
+@pytest.fixture(scope="session")
+def item2():
+    return FeedItem(id="2", title="A2", link="http://a.com/2", published=FIXED_TS, source_name="S2", source_url="http://example.com/s2.xml", source_category="C2")
+
+
+@pytest.fixture(scope="session")
+def item3():
+    """item1과 링크가 같은 항목 (중복 URL)"""
+    return FeedItem(id="3", title="A3", link="http://a.com/1", published=FIXED_TS, source_name="S3", source_url="http://example.com/s3.xml", source_category="C1")
+
+
+@pytest.fixture(scope="session")
+def full_item():
+    """모든 선택 필드가 채워진 항목 (_save_feeds 저장/재로딩 검증용)"""
+    return FeedItem(
+        id="t1",
+        title="Test Title",
+        description="Test Desc",
+        content="Test Content",
+        link="http://test.com/article",
+        published=FIXED_TS,
+        source_name="Test Source",
+        source_url="http://feeds.example.com/test.xml",
+        source_category="Test Cat",
+        tags=["t1", "t2"]
+    )
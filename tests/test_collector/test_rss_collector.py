@@ -1,431 +1,588 @@
 import json
-import os
-import unittest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch, mock_open, call
-import time
 import logging
-from pathlib import Path
+import os
 import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+import time
 
 import feedparser
+import pytest
 from pydantic import ValidationError
 
-# 모듈 경로 설정을 위해 필요할 수 있음 (프로젝트 구조에 따라)
-# import sys
-# sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from app.collector.rss_collector import RSSCollector
+from app.collector.rss_collector import RSSCollector, _default_feed_sources, collect_feeds
 from app.models.schemas import FeedItem
 # 실제 설정 파일을 로드하기 위해 필요
-from app.config import RSS_SOURCES, DATA_DIR 
-
-# 테스트 중 로그 출력을 보기 위해 설정 (선택적)
-# logging.basicConfig(level=logging.DEBUG)
-
-class TestRSSCollector(unittest.TestCase):
-    """RSS 피드 수집 모듈 테스트 클래스"""
-
-    def setUp(self):
-        """테스트 설정"""
-        self.test_sources = [
-            {
-                "name": "Test Feed 1",
-                "url": "https://example.com/feed1.xml",
-                "category": "Technology",
-                "priority": 1, # 예시 우선순위
-                "update_interval": 12 # 예시 업데이트 주기
-            },
-            {
-                "name": "Test Feed 2",
-                "url": "https://example.com/feed2.xml",
-                "category": "AI Research",
-                "priority": 2,
-                "update_interval": 24
-            }
-        ]
-        # timeout 추가
-        self.collector = RSSCollector(feed_sources=self.test_sources, timeout=10)
-        # 임시 디렉토리 생성 for _save_feeds test
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_data_dir = Path(self.temp_dir.name)
-        # DATA_DIR 패치 for _save_feeds test
-        self.data_dir_patch = patch('app.collector.rss_collector.DATA_DIR', self.test_data_dir)
-        # rss_collector 모듈 내의 RAW_FEEDS_DIR도 패치해야 할 수 있음
-        self.raw_feeds_dir_patch = patch('app.collector.rss_collector.RAW_FEEDS_DIR', self.test_data_dir / "raw_feeds")
-        self.data_dir_patch.start()
-        self.raw_feeds_dir_patch.start()
-        # RAW_FEEDS_DIR이 실제로 생성되도록 보장
-        os.makedirs(self.test_data_dir / "raw_feeds", exist_ok=True)
-
-    def tearDown(self):
-        """테스트 종료 후 정리"""
-        self.temp_dir.cleanup()
-        self.data_dir_patch.stop()
-        self.raw_feeds_dir_patch.stop()
-
-    # --- TC-001: _clean_html --- 
-    def test_clean_html(self):
-        """TC-001: HTML 정리 기능 테스트"""
-        html_content = "  <div> Hello  <b>World </b> ! <script>alert('test');</script>Extra space.</div>  "
-        # Expected: script 제거, 태그 제거, 앞뒤/중복 공백 제거, 구두점 앞 공백 제거
-        cleaned_text = self.collector._clean_html(html_content)
-        self.assertEqual(cleaned_text, "Hello World! Extra space.")
-        self.assertEqual(self.collector._clean_html(""), "")
-        self.assertEqual(self.collector._clean_html(None), "")
-
-    # --- TC-003: _remove_duplicates --- 
-    def test_remove_duplicates(self):
-        """TC-003: 중복 제거 기능 테스트"""
-        now = datetime.now()
-        # Use valid URLs for source_url
-        item1 = FeedItem(id="1", title="A1", link="http://a.com/1", published=now, source_name="S1", source_url="http://example.com/s1.xml", source_category="C1")
-        item2 = FeedItem(id="2", title="A2", link="http://a.com/2", published=now, source_name="S2", source_url="http://example.com/s2.xml", source_category="C2")
-        item3 = FeedItem(id="3", title="A3", link="http://a.com/1", published=now, source_name="S3", source_url="http://example.com/s3.xml", source_category="C1") # Duplicate URL
-        items = [item1, item2, item3]
-        unique_items = self.collector._remove_duplicates(items)
-        self.assertEqual(len(unique_items), 2)
-        self.assertEqual(unique_items[0].id, "1")
-        self.assertEqual(unique_items[1].id, "2")
-
-    # --- TC-004: _save_feeds (modified file pattern) --- 
-    def test_save_feeds(self):
-        """TC-004: 피드 저장 기능 테스트 (실제 파일)"""
-        now = datetime.now()
-        item = FeedItem(
-            id="t1", 
-            title="Test Title", 
-            description="Test Desc",
-            content="Test Content",
-            link="http://test.com/article", 
-            published=now, 
-            source_name="Test Source", 
-            source_url="http://feeds.example.com/test.xml", 
-            source_category="Test Cat",
-            tags=["t1", "t2"]
-        )
-        items = [item]
-        
-        self.collector._save_feeds(items)
-
-        expected_dir = self.test_data_dir / "raw_feeds"
-        # Correct the file search pattern to match the actual filename format
-        saved_files = list(expected_dir.glob("feeds_*.json")) 
-        self.assertEqual(len(saved_files), 1, f"Expected 1 file matching 'feeds_*.json', found {len(saved_files)} in {expected_dir}")
-        file_path = saved_files[0]
-        
-        # Verify file content (remains the same)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
-        self.assertEqual(len(saved_data), 1)
-        saved_item = saved_data[0]
-        self.assertEqual(saved_item['id'], item.id)
-        self.assertEqual(saved_item['title'], item.title)
-        self.assertEqual(saved_item['link'], str(item.link))
-        self.assertEqual(datetime.fromisoformat(saved_item['published']), item.published)
-        self.assertEqual(saved_item['source_name'], item.source_name)
-        self.assertEqual(saved_item['source_url'], str(item.source_url)) 
-        self.assertEqual(saved_item['tags'], item.tags)
-        try:
-            FeedItem(**saved_item) # Load back check
-        except ValidationError as e:
-            self.fail(f"Saved JSON data does not match FeedItem schema: {e}")
-
-    # --- 신규 및 보강 테스트 --- 
-
-    @patch('app.collector.rss_collector.RSSCollector.fetch_feed')
-    @patch('app.collector.rss_collector.RSSCollector._remove_duplicates')
-    @patch('app.collector.rss_collector.RSSCollector._save_feeds')
-    def test_fetch_all_feeds(self, mock_save, mock_remove, mock_fetch):
-        """TC-002: 모든 피드 수집 기능 테스트"""
-        # Simulate FeedItem objects (can be MagicMock or real FeedItem)
-        item1 = MagicMock(spec=FeedItem, link="http://a.com/1") 
-        item2 = MagicMock(spec=FeedItem, link="http://a.com/2")
-        item3 = MagicMock(spec=FeedItem, link="http://a.com/3")
-        # Ensure side_effect provides lists of items for each call to fetch_feed
-        mock_fetch.side_effect = [[item1], [item2, item3]]
-        # Simulate remove_duplicates returning a filtered list
-        mock_remove.return_value = [item1, item2] # Assuming item3 was duplicate or filtered
-
-        # Call the method under test
-        result = self.collector.fetch_all_feeds()
-
-        # Assertions
-        self.assertEqual(mock_fetch.call_count, len(self.test_sources))
-        # Check calls were made with the correct source dictionaries
-        mock_fetch.assert_any_call(self.test_sources[0])
-        mock_fetch.assert_any_call(self.test_sources[1])
-        # Check _remove_duplicates was called with the combined list from fetch_feed
-        mock_remove.assert_called_once_with([item1, item2, item3])
-        # Check _save_feeds was called with the result from _remove_duplicates
-        mock_save.assert_called_once_with([item1, item2])
-        # Check the final returned value
-        self.assertEqual(result, [item1, item2])
-
-    def test_load_rss_sources(self):
-        """TC-005: 피드 소스 로딩 및 검증 테스트"""
-        # Uses RSS_SOURCES imported from app.config
-        default_collector = RSSCollector() # Initialize without specific sources
-        self.assertIsNotNone(default_collector.feed_sources)
-        self.assertGreater(len(default_collector.feed_sources), 0)
-        # Check against the imported RSS_SOURCES list
-        self.assertEqual(default_collector.feed_sources, RSS_SOURCES)
-        
-        # Validate structure of each source in the actual config
-        for source in default_collector.feed_sources:
-            self.assertIsInstance(source, dict)
-            self.assertIn('name', source)
-            self.assertIsInstance(source['name'], str)
-            self.assertIn('url', source)
-            self.assertIsInstance(source['url'], str)
-            self.assertTrue(source['url'].startswith('http'), f"URL invalid for {source['name']}: {source['url']}")
-            self.assertIn('category', source)
-            self.assertIsInstance(source['category'], str)
-            # Add checks for other mandatory keys if defined (e.g., priority, update_interval)
-            # self.assertIn('priority', source)
-            # self.assertIsInstance(source['priority'], int)
-            # self.assertIn('update_interval', source)
-            # self.assertIsInstance(source['update_interval'], int)
-
-    @patch('app.collector.rss_collector.feedparser.parse')
-    def test_fetch_feed_invalid_url_or_error(self, mock_parse):
-        """TC-006, TC-014: 잘못된 URL 또는 요청 오류 처리 테스트"""
-        source = self.test_sources[0]
-        
-        # Case 1: Network error (simulated by feedparser raising an exception)
-        # feedparser itself might raise socket.gaierror or similar for bad URLs before timeout
-        # or requests.exceptions.RequestException if it uses requests internally (needs confirmation)
-        # Let's simulate a generic Exception during parse
-        mock_parse.side_effect = Exception("Simulated network/parse error")
-        # Check if ERROR log is generated
-        with self.assertLogs('app.collector.rss_collector', level='ERROR') as cm:
-            items = self.collector.fetch_feed(source)
-        self.assertEqual(items, [])
-        self.assertTrue(any("Simulated network/parse error" in log for log in cm.output))
-        # Ensure the mock was called with the correct URL
-        mock_parse.assert_called_with(source['url'], timeout=self.collector.timeout)
-        
-        # Case 2: Timeout error (simulated by feedparser raising TimeoutError)
-        mock_parse.reset_mock() # Reset call count and side effect
-        mock_parse.side_effect = TimeoutError("Request timed out")
-        with self.assertLogs('app.collector.rss_collector', level='ERROR') as cm:
-             items = self.collector.fetch_feed(source)
-        self.assertEqual(items, [])
-        self.assertTrue(any("timed out" in log for log in cm.output))
-        # Ensure the mock was called again
-        mock_parse.assert_called_with(source['url'], timeout=self.collector.timeout)
-
-    @patch('app.collector.rss_collector.feedparser.parse')
-    def test_fetch_feed_parse_error(self, mock_parse):
-        """TC-010: 단일 피드 수집 (파싱 오류) 테스트"""
-        source = self.test_sources[0]
-        # Simulate parse error (bozo=1, no entries) using feedparser structure
-        mock_error_feed = feedparser.FeedParserDict()
-        mock_error_feed.bozo = 1
-        mock_error_feed.bozo_exception = feedparser.CharacterEncodingOverride("Simulated encoding issue")
-        mock_error_feed.entries = []
-        # Set the return value specifically for this test
-        mock_parse.return_value = mock_error_feed
-        
-        # Check for WARNING log in this case based on current code
-        with self.assertLogs('app.collector.rss_collector', level='WARNING') as cm:
-            items = self.collector.fetch_feed(source)
-        self.assertEqual(items, [])
-        self.assertTrue(any("Simulated encoding issue" in log for log in cm.output))
-        # Ensure the mock was called
-        mock_parse.assert_called_once_with(source['url'], timeout=self.collector.timeout)
-
-    @patch('app.collector.rss_collector.feedparser.parse')
-    def test_fetch_feed_empty(self, mock_parse):
-        """TC-009: 단일 피드 수집 (빈 피드) 테스트"""
-        source = self.test_sources[0]
-        # Simulate empty feed (bozo=0, no entries)
-        mock_empty_feed = feedparser.FeedParserDict()
-        mock_empty_feed.bozo = 0
-        mock_empty_feed.entries = []
-        # Set the return value specifically for this test
-        mock_parse.return_value = mock_empty_feed
-        
-        items = self.collector.fetch_feed(source)
-        self.assertEqual(items, [])
-        # Ensure no error/warning logs in this case
-        # (Optional: check logs are clean if necessary)
-        # Ensure the mock was called
-        mock_parse.assert_called_once_with(source['url'], timeout=self.collector.timeout)
-
-    @patch('app.collector.rss_collector.feedparser.parse')
-    def test_fetch_feed_success_and_category(self, mock_parse):
-        """TC-008, TC-007: 단일 피드 수집 성공 및 카테고리 할당 테스트"""
-        source = self.test_sources[0] 
-        source_b = self.test_sources[1]
-        
-        now_struct = time.gmtime()
-        now_dt = datetime.fromtimestamp(time.mktime(now_struct))
-        mock_entry1 = feedparser.FeedParserDict({
-            'title': "Title 1",
-            'link': "http://example.com/1", # Keep as string for mock
-            'summary': "Summary 1",
-            'published_parsed': now_struct, 
-            'tags': [feedparser.FeedParserDict({'term': 'tagA'})]
-        })
-        mock_entry2 = feedparser.FeedParserDict({
-            'title': "Title 2",
-            'link': "http://example.com/2", # Keep as string for mock
-            'summary': "Summary 2",
-            'updated_parsed': now_struct,
-            'categories': [['catB']]
-        })
-
-        mock_feed = feedparser.FeedParserDict()
-        mock_feed.bozo = 0
-        mock_feed.entries = [mock_entry1, mock_entry2]
-        mock_parse.return_value = mock_feed
-        
-        items = self.collector.fetch_feed(source)
-        
-        self.assertEqual(len(items), 2)
-        self.assertEqual(items[0].title, "Title 1")
-        self.assertEqual(items[1].title, "Title 2")
-        # Compare link by converting FeedItem.link (HttpUrl) to string
-        self.assertEqual(str(items[0].link), "http://example.com/1")
-        self.assertEqual(str(items[1].link), "http://example.com/2")
-        self.assertEqual(items[0].published, now_dt)
-        self.assertEqual(items[1].published, now_dt)
-        self.assertEqual(items[0].source_category, "Technology")
-        self.assertEqual(items[1].source_category, "Technology")
-        self.assertEqual(items[0].source_name, source['name'])
-        # Compare source_url by converting to string
-        self.assertEqual(str(items[0].source_url), source['url'])
-        self.assertIn('tagA', items[0].tags)
-        self.assertIn('catB', items[1].tags)
-        mock_parse.assert_called_once_with(source['url'], timeout=self.collector.timeout)
-
-        mock_parse.reset_mock()
-        items_b = self.collector.fetch_feed(source_b)
-        self.assertEqual(len(items_b), 2)
-        self.assertEqual(items_b[0].source_category, "AI Research")
-        self.assertEqual(items_b[1].source_category, "AI Research")
-        mock_parse.assert_called_once_with(source_b['url'], timeout=self.collector.timeout)
-
-    def test_parse_date(self):
-        """TC-011: 날짜 파싱 테스트"""
-        # Create mock entries with different date fields
-        # Note: time.mktime can be platform dependent or affected by timezone.
-        # Using fixed datetime objects and converting to struct_time is safer.
-        dt_pub = datetime(2023, 3, 15, 10, 0, 0)
-        dt_upd = datetime(2023, 3, 16, 11, 30, 0)
-        dt_cre = datetime(2023, 3, 17, 12, 45, 0)
-        st_pub = dt_pub.timetuple()
-        st_upd = dt_upd.timetuple()
-        st_cre = dt_cre.timetuple()
-
-        entry_published = feedparser.FeedParserDict({'published_parsed': st_pub})
-        entry_updated = feedparser.FeedParserDict({'updated_parsed': st_upd}) # No published_parsed
-        # Test fallback: updated_parsed missing, check created_parsed
-        entry_created = feedparser.FeedParserDict({'created_parsed': st_cre}) # No published or updated
-        entry_none = feedparser.FeedParserDict({}) # No date fields
-        entry_invalid = feedparser.FeedParserDict({'published_parsed': None}) # Field exists but is None
-
-        parsed_dt1 = self.collector._parse_date(entry_published)
-        parsed_dt2 = self.collector._parse_date(entry_updated)
-        parsed_dt3 = self.collector._parse_date(entry_created)
-        parsed_dt_none = self.collector._parse_date(entry_none)
-        parsed_dt_invalid = self.collector._parse_date(entry_invalid)
-        
-        self.assertEqual(parsed_dt1, dt_pub)
-        self.assertEqual(parsed_dt2, dt_upd)
-        self.assertEqual(parsed_dt3, dt_cre)
-        # Check if fallback to current time is within a reasonable delta (e.g., 5 seconds)
-        self.assertAlmostEqual(parsed_dt_none, datetime.now(), delta=timedelta(seconds=5))
-        self.assertAlmostEqual(parsed_dt_invalid, datetime.now(), delta=timedelta(seconds=5))
-
-    def test_extract_content(self):
-        """TC-012: 콘텐츠 추출 및 정리 테스트"""
-        # Case 1: Has HTML content in entry.content list
-        mock_content_html = feedparser.FeedParserDict({
-            'type': 'text/html', 
-            'value': ' <p> Test <b>content</b> here. </p> '
-        })
-        mock_content_text = feedparser.FeedParserDict({
-             'type': 'text/plain', 
-             'value': ' Plain text content '
-         })
-        # Entry with both html and text content (html should be preferred if type is text/html)
-        entry_content_html = feedparser.FeedParserDict({
-            'content': [mock_content_text, mock_content_html], # Order matters if logic checks first
-            'summary': 'Should ignore summary'
-        })
-        content1 = self.collector._extract_content(entry_content_html)
-        self.assertEqual(content1, "Test content here.")
-
-        # Case 2: Has only summary (HTML inside summary)
-        entry_summary = feedparser.FeedParserDict({
-            'summary': ' <div> Simple <i>summary</i>. </div> '
-        })
-        content2 = self.collector._extract_content(entry_summary)
-        self.assertEqual(content2, "Simple summary.")
-        
-        # Case 3: No content or summary
-        entry_none = feedparser.FeedParserDict({})
-        content3 = self.collector._extract_content(entry_none)
-        self.assertEqual(content3, "")
-        
-        # Case 4: Content field exists but is empty or has no value
-        entry_empty_content = feedparser.FeedParserDict({'content': []})
-        content4 = self.collector._extract_content(entry_empty_content)
-        self.assertEqual(content4, "")
-        mock_content_no_value = feedparser.FeedParserDict({'type': 'text/html'})
-        entry_no_value = feedparser.FeedParserDict({'content': [mock_content_no_value]})
-        content5 = self.collector._extract_content(entry_no_value)
-        self.assertEqual(content5, "")
-
-    def test_extract_tags(self):
-        """TC-013: 태그 추출 테스트"""
-        # Case 1: Has tags attribute (list of dicts with 'term')
-        entry_tags = feedparser.FeedParserDict({
-            'tags': [feedparser.FeedParserDict({'term': 'AI'}), 
-                     feedparser.FeedParserDict({'term': 'ML'}), 
-                     feedparser.FeedParserDict({'term': 'AI'})] # Duplicate tag
-        })
-        tags1 = self.collector._extract_tags(entry_tags)
-        self.assertCountEqual(tags1, ['AI', 'ML']) # Check elements regardless of order, duplicates removed
-        
-        # Case 2: Has categories attribute (list of lists/tuples)
-        entry_cats_tuple = feedparser.FeedParserDict({
-            'categories': [['Research'], ['NLP']]
-        })
-        tags2 = self.collector._extract_tags(entry_cats_tuple)
-        self.assertCountEqual(tags2, ['Research', 'NLP'])
-        
-        # Case 3: Has categories attribute (list of strings) - less common but possible
-        # Note: feedparser usually returns list of lists for categories
-        entry_cats_str = feedparser.FeedParserDict({
-             'categories': ['News', 'Tech', 'News'] # Duplicate category
-        })
-        # Depending on the exact parsing logic in _extract_tags for string lists:
-        # Assuming it handles simple strings directly:
-        tags3 = self.collector._extract_tags(entry_cats_str)
-        self.assertCountEqual(tags3, ['News', 'Tech'])
-        
-        # Case 4: Has both tags and categories
-        entry_both = feedparser.FeedParserDict({
-            'tags': [feedparser.FeedParserDict({'term': 'Python'})], 
-            'categories': [['Programming'], ['Python']] # Duplicate via category
-        })
-        tags4 = self.collector._extract_tags(entry_both)
-        self.assertCountEqual(tags4, ['Python', 'Programming'])
-        
-        # Case 5: No tags or categories
-        entry_none = feedparser.FeedParserDict({})
-        tags5 = self.collector._extract_tags(entry_none)
-        self.assertEqual(tags5, [])
-        
-        # Case 6: Empty tag term or category
-        entry_empty_term = feedparser.FeedParserDict({
-            'tags': [feedparser.FeedParserDict({'term': ''}), feedparser.FeedParserDict({'term': 'Valid'})]
-        })
-        tags6 = self.collector._extract_tags(entry_empty_term)
-        self.assertCountEqual(tags6, ['Valid'])
-
-if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+from app.config import RSS_SOURCES
+from tests._assertions import assert_logged
+
+# 수집기/피드 소스 fixture는 tests/test_collector/conftest.py 참조
+
+# 리눅스에서는 메모리 기반 tmpfs(/dev/shm)에 저장해 테스트 중 디스크 I/O를 없앰
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+@pytest.fixture
+def raw_feeds_dir(monkeypatch):
+    """_save_feeds가 임시 디렉토리(가능하면 tmpfs)에 저장하도록 DATA_DIR/RAW_FEEDS_DIR 패치"""
+    with tempfile.TemporaryDirectory(dir=SHM_DIR) as temp_dir:
+        data_dir = Path(temp_dir)
+        raw_dir = data_dir / "raw_feeds"
+        raw_dir.mkdir()
+        monkeypatch.setattr('app.collector.rss_collector.DATA_DIR', data_dir)
+        monkeypatch.setattr('app.collector.rss_collector.RAW_FEEDS_DIR', raw_dir)
+        yield raw_dir
+
+# --- TC-001: _clean_html ---
+def test_clean_html(collector):
+    """TC-001: HTML 정리 기능 테스트"""
+    html_content = "  <div> Hello  <b>World </b> ! <script>alert('test');</script>Extra space.</div>  "
+    # Expected: script 제거, 태그 제거, 앞뒤/중복 공백 제거, 구두점 앞 공백 제거
+    cleaned_text = collector._clean_html(html_content)
+    assert cleaned_text == "Hello World! Extra space."
+    assert collector._clean_html("") == ""
+    assert collector._clean_html(None) == ""
+    # 인접 블록 태그 사이 공백 유지, 주석/style 제거, 엔티티 해제, 태그가 아닌 '<' 보존
+    assert collector._clean_html("<p>a</p><p>b</p><!-- c --><style>p{}</style>") == "a b"
+    assert collector._clean_html("Tom &amp; Jerry&nbsp; !") == "Tom & Jerry!"
+    assert collector._clean_html("a < b and c > d") == "a < b and c > d"
+    # 따옴표 속성 안의 '>', 닫히지 않은 script, CDATA 텍스트 처리
+    assert collector._clean_html('<a title="x>y">link</a> text') == "link text"
+    assert collector._clean_html("<p>x</p><script>var a=1") == "x"
+    assert collector._clean_html("<![CDATA[foo]]> bar") == "foo bar"
+
+# --- TC-003: _remove_duplicates ---
+def test_remove_duplicates(collector, item1, item2, item3):
+    """TC-003: 중복 제거 기능 테스트"""
+    items = [item1, item2, item3] # item3는 item1과 URL 중복
+    unique_items = collector._remove_duplicates(items)
+    assert len(unique_items) == 2
+    assert unique_items[0].id == "1"
+    assert unique_items[1].id == "2"
+    # 먼저 나온 항목을 복사 없이 그대로 유지하는지 확인 (항목 재생성 시 실패)
+    assert unique_items[0] is item1
+    assert unique_items[1] is item2
+    assert all(unique is not item3 for unique in unique_items)
+
+# --- TC-004: _save_feeds (modified file pattern) ---
+def test_save_feeds(collector, raw_feeds_dir, full_item):
+    """TC-004: 피드 저장 기능 테스트 (실제 파일)"""
+    item = full_item
+    items = [item]
+
+    collector._save_feeds(items)
+
+    # Correct the file search pattern to match the actual filename format
+    saved_files = list(raw_feeds_dir.glob("feeds_*.json"))
+    assert len(saved_files) == 1, f"Expected 1 file matching 'feeds_*.json', found {len(saved_files)} in {raw_feeds_dir}"
+    file_path = saved_files[0]
+
+    # Verify file content (remains the same)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        saved_data = json.load(f)
+    assert len(saved_data) == 1
+    saved_item = saved_data[0]
+    assert saved_item['id'] == item.id
+    assert saved_item['title'] == item.title
+    assert saved_item['link'] == str(item.link)
+    assert datetime.fromisoformat(saved_item['published']) == item.published
+    assert saved_item['source_name'] == item.source_name
+    assert saved_item['source_url'] == str(item.source_url)
+    assert saved_item['tags'] == item.tags
+    try:
+        FeedItem(**saved_item) # Load back check
+    except ValidationError as e:
+        pytest.fail(f"Saved JSON data does not match FeedItem schema: {e}")
+
+# --- 신규 및 보강 테스트 ---
+
+@patch('app.collector.rss_collector.RSSCollector.fetch_feed')
+@patch('app.collector.rss_collector.RSSCollector._remove_duplicates')
+@patch('app.collector.rss_collector.RSSCollector._save_feeds')
+def test_fetch_all_feeds(mock_save, mock_remove, mock_fetch, collector, test_sources, item1, item2, item3):
+    """TC-002: 모든 피드 수집 기능 테스트"""
+    # 세션 공유 FeedItem 사용 (_remove_duplicates/_save_feeds는 모의 객체이므로 변경되지 않음)
+    # 피드는 스레드 풀에서 동시에 수집되어 호출 순서가 보장되지 않으므로 소스 이름으로 결과를 지정
+    feed_results = {test_sources[0]['name']: [item1], test_sources[1]['name']: [item2, item3]}
+    mock_fetch.side_effect = lambda source: feed_results[source['name']]
+    # Simulate remove_duplicates returning a filtered list
+    mock_remove.return_value = [item1, item2] # Assuming item3 was duplicate or filtered
+
+    # Call the method under test
+    result = collector.fetch_all_feeds()
+
+    # Assertions
+    assert mock_fetch.call_count == len(test_sources)
+    # Check calls were made with the correct source dictionaries (모든 소스를 한 번에 검증)
+    mock_fetch.assert_has_calls([call(source) for source in test_sources], any_order=True)
+    # Check _remove_duplicates was called with the combined list from fetch_feed (소스 순서 유지)
+    mock_remove.assert_called_once_with([item1, item2, item3])
+    # Check _save_feeds was called with the result from _remove_duplicates
+    mock_save.assert_called_once_with([item1, item2])
+    # Check the final returned value
+    assert result == [item1, item2]
+
+@patch('app.collector.rss_collector.RSSCollector.fetch_feed')
+@patch('app.collector.rss_collector.RSSCollector._save_feeds')
+def test_fetch_all_feeds_source_failure(mock_save, mock_fetch, collector, test_sources, item2, caplog):
+    """한 소스 수집이 예외로 실패해도 나머지 소스 결과는 수집되는지 테스트"""
+    def fetch(source):
+        if source['name'] == test_sources[0]['name']:
+            raise RuntimeError("Simulated fetch failure")
+        return [item2]
+    mock_fetch.side_effect = fetch
+
+    result = collector.fetch_all_feeds()
+
+    assert result == [item2]
+    mock_save.assert_called_once_with([item2])
+    assert_logged(caplog, logging.ERROR, "Simulated fetch failure")
+
+def test_collect_feeds(mock_collector, item1, item2):
+    """collect_feeds 헬퍼가 기본 설정의 수집기로 전체 피드를 수집해 반환하는지 테스트"""
+    mock_collector.fetch_all_feeds.return_value = [item1, item2]
+
+    with patch('app.collector.rss_collector.RSSCollector', return_value=mock_collector) as mock_cls:
+        result = collect_feeds()
+
+    mock_cls.assert_called_once_with() # 기본 소스(RSS_SOURCES) 사용
+    mock_collector.fetch_all_feeds.assert_called_once_with()
+    assert result == [item1, item2]
+
+def test_invalid_default_sources(caplog):
+    """기본 소스(RSS_SOURCES) 설정 오류는 모듈 임포트가 아니라 기본 소스 사용 시점에 오류 로그와 함께 발생하는지 테스트"""
+    _default_feed_sources.cache_clear()
+    try:
+        with patch('app.collector.rss_collector.RSS_SOURCES', [{"name": "Broken", "category": "Tech"}]): # url 누락
+            with pytest.raises(ValidationError):
+                RSSCollector()
+        assert_logged(caplog, logging.ERROR, "RSS_SOURCES 설정 오류")
+        # 명시적으로 전달한 소스는 기본 소스 검증과 무관
+        with patch('app.collector.rss_collector.RSS_SOURCES', []):
+            assert RSSCollector(feed_sources=[{"name": "A", "url": "u", "category": "c"}]).feed_sources[0]["name"] == "A"
+    finally:
+        _default_feed_sources.cache_clear()
+
+def test_load_rss_sources():
+    """TC-005: 피드 소스 로딩 및 검증 테스트"""
+    # Uses RSS_SOURCES imported from app.config
+    default_collector = RSSCollector() # Initialize without specific sources
+    assert default_collector.feed_sources is not None
+    assert len(default_collector.feed_sources) > 0
+    # Check against the imported RSS_SOURCES list
+    assert default_collector.feed_sources == RSS_SOURCES
+
+    # Validate structure of each source in the actual config
+    for source in default_collector.feed_sources:
+        assert isinstance(source, dict)
+        assert 'name' in source
+        assert isinstance(source['name'], str)
+        assert 'url' in source
+        assert isinstance(source['url'], str)
+        assert source['url'].startswith('http'), f"URL invalid for {source['name']}: {source['url']}"
+        assert 'category' in source
+        assert isinstance(source['category'], str)
+        # Add checks for other mandatory keys if defined (e.g., priority, update_interval)
+        # assert 'priority' in source
+        # assert isinstance(source['priority'], int)
+        # assert 'update_interval' in source
+        # assert isinstance(source['update_interval'], int)
+
+@patch('app.collector.rss_collector.feedparser.parse')
+def test_fetch_feed_invalid_url_or_error(mock_parse, collector, test_sources, caplog):
+    """TC-006, TC-014: 잘못된 URL 또는 요청 오류 처리 테스트"""
+    source = test_sources[0]
+
+    # Case 1: Network error (simulated by feedparser raising an exception)
+    # feedparser itself might raise socket.gaierror or similar for bad URLs before timeout
+    # or requests.exceptions.RequestException if it uses requests internally (needs confirmation)
+    # Let's simulate a generic Exception during parse
+    mock_parse.side_effect = Exception("Simulated network/parse error")
+    # Check if ERROR log is generated
+    items = collector.fetch_feed(source)
+    assert items == []
+    assert_logged(caplog, logging.ERROR, "Simulated network/parse error")
+    # Ensure the mock was called with the correct URL
+    mock_parse.assert_called_with(source['url'], timeout=collector.timeout)
+
+    # Case 2: Timeout error (simulated by feedparser raising TimeoutError)
+    mock_parse.reset_mock() # Reset call count and side effect
+    caplog.clear()
+    mock_parse.side_effect = TimeoutError("Request timed out")
+    items = collector.fetch_feed(source)
+    assert items == []
+    assert_logged(caplog, logging.ERROR, "timed out")
+    # Ensure the mock was called again
+    mock_parse.assert_called_with(source['url'], timeout=collector.timeout)
+
+@patch('app.collector.rss_collector.feedparser.parse')
+def test_fetch_feed_parse_error(mock_parse, collector, test_sources, caplog):
+    """TC-010: 단일 피드 수집 (파싱 오류) 테스트"""
+    source = test_sources[0]
+    # Simulate parse error (bozo=1, no entries) using feedparser structure
+    mock_error_feed = feedparser.FeedParserDict()
+    mock_error_feed.bozo = 1
+    mock_error_feed.bozo_exception = feedparser.CharacterEncodingOverride("Simulated encoding issue")
+    mock_error_feed.entries = []
+    # Set the return value specifically for this test
+    mock_parse.return_value = mock_error_feed
+
+    # Check for WARNING log in this case based on current code
+    items = collector.fetch_feed(source)
+    assert items == []
+    assert_logged(caplog, logging.WARNING, "Simulated encoding issue")
+    # Ensure the mock was called
+    mock_parse.assert_called_once_with(source['url'], timeout=collector.timeout)
+
+@patch('app.collector.rss_collector.feedparser.parse')
+def test_fetch_feed_empty(mock_parse, collector, test_sources):
+    """TC-009: 단일 피드 수집 (빈 피드) 테스트"""
+    source = test_sources[0]
+    # Simulate empty feed (bozo=0, no entries)
+    mock_empty_feed = feedparser.FeedParserDict()
+    mock_empty_feed.bozo = 0
+    mock_empty_feed.entries = []
+    # Set the return value specifically for this test
+    mock_parse.return_value = mock_empty_feed
+
+    items = collector.fetch_feed(source)
+    assert items == []
+    # Ensure no error/warning logs in this case
+    # (Optional: check logs are clean if necessary)
+    # Ensure the mock was called
+    mock_parse.assert_called_once_with(source['url'], timeout=collector.timeout)
+
+@patch('app.collector.rss_collector.feedparser.parse')
+def test_fetch_feed_success_and_category(mock_parse, collector, test_sources):
+    """TC-008, TC-007: 단일 피드 수집 성공 및 카테고리 할당 테스트"""
+    source = test_sources[0]
+    source_b = test_sources[1]
+
+    now_struct = time.gmtime()
+    # _parse_date는 struct_time(UTC) 필드를 그대로 쓰는 UTC 기준 naive datetime을 반환 (로컬 시간대와 무관)
+    now_dt = datetime(*now_struct[:6])
+    mock_entry1 = feedparser.FeedParserDict({
+        'title': "Title 1",
+        'link': "http://example.com/1", # Keep as string for mock
+        'summary': "Summary 1",
+        'published_parsed': now_struct,
+        'tags': [feedparser.FeedParserDict({'term': 'tagA'})]
+    })
+    mock_entry2 = feedparser.FeedParserDict({
+        'title': "Title 2",
+        'link': "http://example.com/2", # Keep as string for mock
+        'summary': "Summary 2",
+        'updated_parsed': now_struct,
+        'categories': [['catB']]
+    })
+
+    mock_feed = feedparser.FeedParserDict()
+    mock_feed.bozo = 0
+    mock_feed.entries = [mock_entry1, mock_entry2]
+    mock_parse.return_value = mock_feed
+
+    items = collector.fetch_feed(source)
+
+    assert len(items) == 2
+    assert items[0].title == "Title 1"
+    assert items[1].title == "Title 2"
+    # Compare link by converting FeedItem.link (HttpUrl) to string
+    assert str(items[0].link) == "http://example.com/1"
+    assert str(items[1].link) == "http://example.com/2"
+    assert items[0].published == now_dt
+    assert items[1].published == now_dt
+    assert items[0].source_category == "Technology"
+    assert items[1].source_category == "Technology"
+    assert items[0].source_name == source['name']
+    # Compare source_url by converting to string
+    assert str(items[0].source_url) == source['url']
+    assert 'tagA' in items[0].tags
+    assert 'catB' in items[1].tags
+    mock_parse.assert_called_once_with(source['url'], timeout=collector.timeout)
+
+    mock_parse.reset_mock()
+    items_b = collector.fetch_feed(source_b)
+    assert len(items_b) == 2
+    assert items_b[0].source_category == "AI Research"
+    assert items_b[1].source_category == "AI Research"
+    mock_parse.assert_called_once_with(source_b['url'], timeout=collector.timeout)
+
+@patch('app.collector.rss_collector.feedparser.parse')
+def test_fetch_feed_skips_invalid_item(mock_parse, collector, test_sources, caplog):
+    """목록 일괄 검증이 실패하면 잘못된 항목만 제외하고 나머지는 반환하는지 테스트"""
+    source = test_sources[0]
+    mock_feed = feedparser.FeedParserDict()
+    mock_feed.bozo = 0
+    mock_feed.entries = [
+        feedparser.FeedParserDict({'title': "Valid", 'link': "http://example.com/valid", 'summary': "ok"}),
+        feedparser.FeedParserDict({'title': "Invalid", 'link': "not-a-url", 'summary': "bad link"}),
+    ]
+    mock_parse.return_value = mock_feed
+
+    items = collector.fetch_feed(source)
+
+    assert [item.title for item in items] == ["Valid"]
+    assert_logged(caplog, logging.WARNING, "피드 항목 파싱 오류")
+
+STREAM_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+<title>Stream Feed</title>
+<item>
+<title>Stream 1</title>
+<link>http://example.com/s1</link>
+<description>Summary 1</description>
+<content:encoded><![CDATA[<p>Full <b>content</b> 1.</p>]]></content:encoded>
+<pubDate>Wed, 15 Mar 2023 10:00:00 +0000</pubDate>
+<category>tagS</category>
+</item>
+<!-- comment -->
+<item>
+<title>Stream 2</title>
+<link>http://example.com/s2</link>
+<description>&lt;p&gt;Summary 2&lt;/p&gt;</description>
+</item>
+</channel>
+</rss>"""
+
+@patch('app.collector.rss_collector.feedparser.parse')
+@patch('app.collector.rss_collector.requests.get')
+def test_fetch_feed_stream_parse(mock_get, mock_parse, test_sources):
+    """stream_parse=True일 때 lxml 스트리밍 파싱 결과가 feedparser 경로와 같은 FeedItem으로 변환되는지 테스트"""
+    source = test_sources[0]
+    stream_collector = RSSCollector(feed_sources=test_sources, timeout=10, stream_parse=True)
+    response = mock_get.return_value.__enter__.return_value
+    # 작은 청크로 나눠 item이 청크 경계에 걸쳐도 파싱되는지 확인
+    response.iter_content.return_value = [STREAM_RSS[i:i + 50] for i in range(0, len(STREAM_RSS), 50)]
+
+    items = stream_collector.fetch_feed(source)
+
+    mock_parse.assert_not_called()
+    assert mock_get.call_args.args == (source['url'],)
+    assert mock_get.call_args.kwargs['stream'] is True
+    assert [item.title for item in items] == ["Stream 1", "Stream 2"]
+    assert str(items[0].link) == "http://example.com/s1"
+    assert items[0].content == "Full content 1."
+    assert items[0].published == datetime(2023, 3, 15, 10, 0, 0)
+    assert items[0].tags == ["tagS"]
+    assert items[1].content == "Summary 2"
+    assert items[1].tags == []
+
+@pytest.mark.parametrize("body", [
+    b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title></feed>', # item 없음
+    b'<rss><channel><item><title>Broken</title></channel></rss>', # 잘못된 XML
+])
+@patch('app.collector.rss_collector.feedparser.parse')
+@patch('app.collector.rss_collector.requests.get')
+def test_fetch_feed_stream_parse_fallback(mock_get, mock_parse, body, test_sources):
+    """스트리밍 파싱으로 item을 얻지 못하면 다시 요청하지 않고 받은 본문 전체를 응답 헤더와 함께 feedparser로 파싱하는지 테스트"""
+    source = test_sources[0]
+    stream_collector = RSSCollector(feed_sources=test_sources, timeout=10, stream_parse=True)
+    response = mock_get.return_value.__enter__.return_value
+    # 작은 청크로 나눠 파싱 오류 이후의 청크도 끝까지 받아 전달하는지 확인
+    response.iter_content.return_value = [body[i:i + 10] for i in range(0, len(body), 10)]
+    response.headers = {'Content-Type': 'application/xml; charset=utf-8'}
+    response.url = source['url']
+    mock_feed = feedparser.FeedParserDict()
+    mock_feed.bozo = 0
+    mock_feed.entries = []
+    # 본문은 임시 파일 객체로 전달되고 파싱 후 닫히므로 호출 시점에 내용을 읽어 둠
+    received = []
+    def fake_parse(stream, response_headers):
+        received.append((stream.read(), response_headers))
+        return mock_feed
+    mock_parse.side_effect = fake_parse
+
+    assert stream_collector.fetch_feed(source) == []
+    mock_get.assert_called_once()
+    assert received == [
+        (body, {'content-type': 'application/xml; charset=utf-8', 'content-location': source['url']})
+    ]
+
+class FakeResponse:
+    """aiohttp 응답 대역 (async with 및 raise_for_status/read, headers/url만 지원)"""
+
+    def __init__(self, body: bytes = b"", error: Exception = None, headers: dict = None, url: str = "https://example.com/feed1.xml"):
+        self.body = body
+        self.error = error
+        self.headers = headers or {}
+        self.url = url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.error:
+            raise self.error
+
+    async def read(self):
+        return self.body
+
+@patch('app.collector.rss_collector.RSSCollector._fetch_source_async')
+@patch('app.collector.rss_collector.RSSCollector._remove_duplicates')
+@patch('app.collector.rss_collector.RSSCollector._save_feeds')
+async def test_fetch_all_feeds_async(mock_save, mock_remove, mock_fetch, collector, test_sources, item1, item2, item3):
+    """비동기 전체 수집이 소스 순서대로 결과를 합쳐 중복 제거/저장하는지 테스트"""
+    feed_results = {test_sources[0]['name']: [item1], test_sources[1]['name']: [item2, item3]}
+    mock_fetch.side_effect = lambda session, source: feed_results[source['name']]
+    mock_remove.return_value = [item1, item2]
+
+    result = await collector.fetch_all_feeds_async()
+
+    assert mock_fetch.await_count == len(test_sources)
+    assert [c.args[1] for c in mock_fetch.await_args_list] == test_sources
+    mock_remove.assert_called_once_with([item1, item2, item3])
+    mock_save.assert_called_once_with([item1, item2])
+    assert result == [item1, item2]
+
+async def test_fetch_source_async(collector, test_sources, caplog):
+    """단일 소스 비동기 수집: 본문을 feedparser로 파싱해 FeedItem으로 변환하고, 요청 실패 시 빈 목록 반환"""
+    source = test_sources[0]
+    session = MagicMock()
+    session.get.return_value = FakeResponse(STREAM_RSS)
+
+    items = await collector._fetch_source_async(session, source)
+
+    session.get.assert_called_once_with(source['url'])
+    assert [item.title for item in items] == ["Stream 1", "Stream 2"]
+    assert items[0].source_category == source['category']
+    assert items[0].published == datetime(2023, 3, 15, 10, 0, 0)
+
+    # 응답 헤더의 문자셋과 기준 URL(content-location 기본값은 응답 URL)이 파싱에 반영되는지 확인
+    euc_kr_rss = '<rss version="2.0"><channel><item><title>한글 제목</title><link>/news/1</link></item></channel></rss>'.encode('euc-kr')
+    session.get.return_value = FakeResponse(euc_kr_rss, headers={'Content-Type': 'application/rss+xml; charset=euc-kr'})
+    items = await collector._fetch_source_async(session, source)
+    assert items[0].title == "한글 제목"
+    assert str(items[0].link) == "https://example.com/news/1"
+
+    session.get.return_value = FakeResponse(error=RuntimeError("Simulated HTTP error"))
+    assert await collector._fetch_source_async(session, source) == []
+    assert_logged(caplog, logging.ERROR, "Simulated HTTP error")
+
+# 필드가 하나도 없는 엔트리 (_parse_date/_extract_* 는 엔트리를 읽기만 하므로 모듈에서 한 번만 생성해 공유)
+EMPTY_ENTRY = feedparser.FeedParserDict({})
+
+def test_parse_date(collector):
+    """TC-011: 날짜 파싱 테스트"""
+    # Create mock entries with different date fields
+    # Note: time.mktime can be platform dependent or affected by timezone.
+    # Using fixed datetime objects and converting to struct_time is safer.
+    dt_pub = datetime(2023, 3, 15, 10, 0, 0)
+    dt_upd = datetime(2023, 3, 16, 11, 30, 0)
+    dt_cre = datetime(2023, 3, 17, 12, 45, 0)
+    st_pub = dt_pub.timetuple()
+    st_upd = dt_upd.timetuple()
+    st_cre = dt_cre.timetuple()
+
+    entry_published = feedparser.FeedParserDict({'published_parsed': st_pub})
+    entry_updated = feedparser.FeedParserDict({'updated_parsed': st_upd}) # No published_parsed
+    # Test fallback: updated_parsed missing, check created_parsed
+    entry_created = feedparser.FeedParserDict({'created_parsed': st_cre}) # No published or updated
+    entry_none = EMPTY_ENTRY # No date fields
+    entry_invalid = feedparser.FeedParserDict({'published_parsed': None}) # Field exists but is None
+
+    parsed_dt1 = collector._parse_date(entry_published)
+    parsed_dt2 = collector._parse_date(entry_updated)
+    parsed_dt3 = collector._parse_date(entry_created)
+    # 날짜가 없으면 호출 시점의 현재 시간으로 대체되는지 호출 전후 시각으로 확인
+    before = datetime.now()
+    parsed_dt_none = collector._parse_date(entry_none)
+    parsed_dt_invalid = collector._parse_date(entry_invalid)
+    after = datetime.now()
+
+    assert parsed_dt1 == dt_pub
+    assert parsed_dt2 == dt_upd
+    assert parsed_dt3 == dt_cre
+    assert before <= parsed_dt_none <= after
+    assert before <= parsed_dt_invalid <= after
+
+def test_extract_content(collector):
+    """TC-012: 콘텐츠 추출 및 정리 테스트"""
+    # Case 1: Has HTML content in entry.content list
+    mock_content_html = feedparser.FeedParserDict({
+        'type': 'text/html',
+        'value': ' <p> Test <b>content</b> here. </p> '
+    })
+    mock_content_text = feedparser.FeedParserDict({
+         'type': 'text/plain',
+         'value': ' Plain text content '
+     })
+    # Entry with both html and text content (html should be preferred if type is text/html)
+    entry_content_html = feedparser.FeedParserDict({
+        'content': [mock_content_text, mock_content_html], # Order matters if logic checks first
+        'summary': 'Should ignore summary'
+    })
+    content1 = collector._extract_content(entry_content_html)
+    assert content1 == "Test content here."
+
+    # Case 2: Has only summary (HTML inside summary)
+    entry_summary = feedparser.FeedParserDict({
+        'summary': ' <div> Simple <i>summary</i>. </div> '
+    })
+    content2 = collector._extract_content(entry_summary)
+    assert content2 == "Simple summary."
+
+    # Case 3: No content or summary
+    entry_none = EMPTY_ENTRY
+    content3 = collector._extract_content(entry_none)
+    assert content3 == ""
+
+    # Case 4: Content field exists but is empty or has no value
+    entry_empty_content = feedparser.FeedParserDict({'content': []})
+    content4 = collector._extract_content(entry_empty_content)
+    assert content4 == ""
+    mock_content_no_value = feedparser.FeedParserDict({'type': 'text/html'})
+    entry_no_value = feedparser.FeedParserDict({'content': [mock_content_no_value]})
+    content5 = collector._extract_content(entry_no_value)
+    assert content5 == ""
+
+def test_extract_tags(collector):
+    """TC-013: 태그 추출 테스트"""
+    # Case 1: Has tags attribute (list of dicts with 'term')
+    entry_tags = feedparser.FeedParserDict({
+        'tags': [feedparser.FeedParserDict({'term': 'AI'}),
+                 feedparser.FeedParserDict({'term': 'ML'}),
+                 feedparser.FeedParserDict({'term': 'AI'})] # Duplicate tag
+    })
+    tags1 = collector._extract_tags(entry_tags)
+    assert sorted(tags1) == sorted(['AI', 'ML']) # Check elements regardless of order, duplicates removed
+
+    # Case 2: Has categories attribute (list of lists/tuples)
+    entry_cats_tuple = feedparser.FeedParserDict({
+        'categories': [['Research'], ['NLP']]
+    })
+    tags2 = collector._extract_tags(entry_cats_tuple)
+    assert sorted(tags2) == sorted(['Research', 'NLP'])
+
+    # Case 3: Has categories attribute (list of strings) - less common but possible
+    # Note: feedparser usually returns list of lists for categories
+    entry_cats_str = feedparser.FeedParserDict({
+         'categories': ['News', 'Tech', 'News'] # Duplicate category
+    })
+    # Depending on the exact parsing logic in _extract_tags for string lists:
+    # Assuming it handles simple strings directly:
+    tags3 = collector._extract_tags(entry_cats_str)
+    assert sorted(tags3) == sorted(['News', 'Tech'])
+
+    # Case 4: Has both tags and categories
+    entry_both = feedparser.FeedParserDict({
+        'tags': [feedparser.FeedParserDict({'term': 'Python'})],
+        'categories': [['Programming'], ['Python']] # Duplicate via category
+    })
+    tags4 = collector._extract_tags(entry_both)
+    assert sorted(tags4) == sorted(['Python', 'Programming'])
+
+    # Case 5: No tags or categories
+    entry_none = EMPTY_ENTRY
+    tags5 = collector._extract_tags(entry_none)
+    assert tags5 == []
+
+    # Case 6: Empty tag term or category
+    entry_empty_term = feedparser.FeedParserDict({
+        'tags': [feedparser.FeedParserDict({'term': ''}), feedparser.FeedParserDict({'term': 'Valid'})]
+    })
+    tags6 = collector._extract_tags(entry_empty_term)
+    assert sorted(tags6) == sorted(['Valid'])
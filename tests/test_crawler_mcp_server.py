@@ -1,18 +1,21 @@
-import pytest
 import asyncio
-import json # Import json module
+
+import pytest
+from contextlib import asynccontextmanager
 # Remove httpx imports as TestClient from FastAPI is used
-from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock, patch # Import mocking utilities
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock # Import mocking utilities
+
+from pydantic import BaseModel
 # Remove TestClient import
 # Remove FastAPI import
 
 # Assuming your MCP app instance is crawler_mcp_app in app.mcp.crawler_server
 # We need to import it to create a TestClient
-from app.mcp.crawler_server import crawler_mcp_app, browser_pool, lifespan # Keep lifespan import for potential future use if needed, but FastAPI is removed
+from app.mcp.crawler_server import crawler_mcp_app
 
-# Use pytest-asyncio fixtures for event loop management
-pytest_plugins = ('pytest_asyncio',)
+# 비동기 테스트/fixture는 pytest.ini 설정(asyncio_mode=auto, 세션 이벤트 루프)으로 하나의 루프를 공유
 
 # Use httpx.AsyncClient for testing ASGI applications like FastMCP
 # Note: Using TestClient directly might be better if it handles lifespan correctly
@@ -48,11 +51,106 @@ pytest_plugins = ('pytest_asyncio',)
 # Remove the client fixture entirely
 
 
+# --- Helpers ---
+
+class ToolOutput(BaseModel):
+    """크롤러 MCP 도구 응답 스키마 (도구마다 채워지는 필드가 달라 status 외에는 모두 선택)"""
+    status: str
+    message: Optional[str] = None
+    pool_size: Optional[int] = None
+    available_now: Optional[int] = None
+    page_title: Optional[str] = None
+    status_code: Optional[int] = None
+    extracted_content: Optional[Dict[str, Optional[List[str]]]] = None
+
+
+def parse_tool_output(result_data) -> ToolOutput:
+    """call_tool 결과(TextContent 목록)의 첫 항목 JSON 문자열을 ToolOutput으로 바로 검증/변환 (중간 dict 없음)"""
+    assert isinstance(result_data, list) and len(result_data) > 0
+    return ToolOutput.model_validate_json(result_data[0].text)
+
+
+# --- Fixtures ---
+
+@dataclass(slots=True)
+class FakeBrowserQueue:
+    """browser_pool._browser_queue 대역 (qsize만 지원)"""
+    size: int
+
+    def qsize(self) -> int:
+        return self.size
+
+
+@asynccontextmanager
+async def managed(value):
+    """get_managed_browser() 대역: value를 그대로 넘겨주는 네이티브 비동기 컨텍스트 매니저"""
+    yield value
+
+
+@dataclass(slots=True)
+class FakeBrowserPool:
+    """도구가 get_pool()로 읽는 BrowserPoolManager 상태만 가진 가벼운 대역 (테스트마다 새로 생성)"""
+    pool_size: int = 2
+    _initialized: bool = True
+    _browser_queue: Optional[FakeBrowserQueue] = None
+    browser: Any = None
+    initialize_calls: int = 0
+
+    async def initialize(self) -> None:
+        self.initialize_calls += 1
+
+    def get_managed_browser(self):
+        # 호출마다 새 컨텍스트 매니저를 만들어 여러 번 진입해도 안전
+        return managed(self.browser)
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    """가득 찬 큐를 가진 초기화된 FakeBrowserPool을 crawler_server.get_pool()이 돌려주도록 설치
+
+    모듈 전역 browser_pool 싱글턴은 건드리지 않으므로 테스트 간 공유 상태가 없습니다.
+    """
+    pool = FakeBrowserPool()
+    pool._browser_queue = FakeBrowserQueue(pool.pool_size)
+    monkeypatch.setattr("app.mcp.crawler_server.get_pool", lambda: pool)
+    return pool
+
+
+# 모의 브라우저/페이지는 모듈 로드 시 한 번만 생성하고 mock_page fixture에서 테스트마다 초기화 (Mock 생성 비용 절감)
+_PAGE = AsyncMock()
+_BROWSER = AsyncMock()
+
+
+@pytest.fixture
+def mock_page(fake_pool):
+    """fake_pool.get_managed_browser()가 돌려주는 모의 브라우저의 new_page()로 생성되는 모의 페이지
+
+    브라우저/컨텍스트 매니저 연결을 테스트마다 반복하지 않도록 한 번에 구성합니다.
+    공유 모의 객체의 호출 기록은 reset_mock으로, 테스트가 바꾸는 title 반환값은 따로 초기화하므로 테스트 간에 섞이지 않습니다.
+    (reset_mock(return_value=True)는 __bool__ 등 매직 메서드 반환값까지 지우므로 사용하지 않음)
+    """
+    _PAGE.reset_mock()
+    _PAGE.title.reset_mock(return_value=True)
+    _BROWSER.reset_mock()
+    _BROWSER.new_page.return_value = _PAGE
+    fake_pool.browser = _BROWSER
+    return _PAGE
+
+
 # --- Test Class ---
 
 class TestCrawlerMCPServer:
     """Tests for the Web Crawler MCP Server tools with mocked Playwright."""
 
+    @pytest.fixture(autouse=True)
+    def _patch_goto(self, mocker):
+        """_goto_with_retry를 클래스의 모든 테스트에서 모의 (기본 응답 상태 200, 테스트에서 self.mock_goto.return_value.status로 변경)"""
+        self.mock_goto = mocker.patch(
+            'app.mcp.crawler_server._goto_with_retry',
+            return_value=MagicMock(status=200),
+            new_callable=AsyncMock
+        )
+
     def test_server_initialization(self, mocker):
         """Test if the server initializes the pool (assuming lifespan works with call_tool or manual calls)."""
         # This test might become less meaningful without a client triggering lifespan.
@@ -64,292 +162,167 @@ class TestCrawlerMCPServer:
         # We can check if shutdown is called on exit, but need careful mock management
 
 
-    @pytest.mark.asyncio
-    async def test_launch_browser_tool(self, mocker):
-        """Test the launch_browser MCP tool with mocks using call_tool."""
-        # Mock the pool's state for the test
-        mocker.patch.object(browser_pool, '_initialized', True)
-        mock_queue = MagicMock(spec=asyncio.Queue)
-        mock_queue.qsize.return_value = browser_pool.pool_size # Assume full pool
-        mocker.patch.object(browser_pool, '_browser_queue', mock_queue)
-        # Mock initialize just in case it's called
-        mock_initialize = mocker.patch.object(browser_pool, 'initialize', return_value=None, new_callable=AsyncMock)
-
+    async def test_launch_browser_tool(self, fake_pool):
+        """Test the launch_browser MCP tool with a fake pool using call_tool."""
         # Call the tool directly, passing parameters as a dictionary positional argument
         result_data = await crawler_mcp_app.call_tool("launch_browser", {})
         print(f"DEBUG: call_tool result_data = {result_data}") # Print the result for debugging
 
         # Parse the JSON string from the TextContent object
-        assert isinstance(result_data, list) and len(result_data) > 0
-        # Assuming the first element contains the relevant data
-        # Adjust if the structure is different (e.g., ToolResultContent)
-        # For now, let's assume it's TextContent based on the print output
-        if hasattr(result_data[0], 'text'):
-            tool_output_str = result_data[0].text
-            tool_output = json.loads(tool_output_str)
-        else:
-            # Handle potential different result structures if needed
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "success"
-        assert "Browser pool is initialized" in tool_output["message"]
-        assert tool_output["pool_size"] == browser_pool.pool_size
-        assert tool_output["available_now"] == browser_pool.pool_size
-        mock_initialize.assert_not_awaited() # Should not initialize if already initialized
+        tool_output = parse_tool_output(result_data)
+
+        assert tool_output.status == "success"
+        assert "Browser pool is initialized" in tool_output.message
+        assert tool_output.pool_size == fake_pool.pool_size
+        assert tool_output.available_now == fake_pool.pool_size
+        assert fake_pool.initialize_calls == 0 # Should not initialize if already initialized
 
         # Test case where pool is not initialized initially
-        mocker.patch.object(browser_pool, '_initialized', False)
-        # Re-patch initialize for this specific call assertion
-        mock_initialize_call = mocker.patch.object(browser_pool, 'initialize', return_value=None, new_callable=AsyncMock)
+        fake_pool._initialized = False
         # Call the tool directly again
         result_init_data = await crawler_mcp_app.call_tool("launch_browser", {})
         print(f"DEBUG: call_tool result_init_data = {result_init_data}") # Print the result for debugging
         
         # Parse the result similarly
-        assert isinstance(result_init_data, list) and len(result_init_data) > 0
-        if hasattr(result_init_data[0], 'text'):
-            tool_output_init_str = result_init_data[0].text
-            tool_output_init = json.loads(tool_output_init_str)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_init_data}")
+        tool_output_init = parse_tool_output(result_init_data)
 
         # call_tool doesn't seem to trigger lifespan automatically.
         # The tool correctly returns 'pending' when the pool is not initialized.
-        assert tool_output_init["status"] == "pending" 
-        assert "Browser pool is initializing" in tool_output_init["message"]
+        assert tool_output_init.status == "pending" 
+        assert "Browser pool is initializing" in tool_output_init.message
         # Since initialize isn't called automatically, assert it wasn't awaited
-        mock_initialize_call.assert_not_awaited() 
-
-
-    @pytest.mark.asyncio
-    async def test_crawl_page_tool_success(self, mocker):
-        """Test crawl_page tool success scenario with mocks."""
-        # Mock the browser and page objects returned by the pool
-        mock_page = AsyncMock()
-        mock_page.title = AsyncMock(return_value="Example Domain")
-        mock_page.close = AsyncMock()
+        assert fake_pool.initialize_calls == 0
 
-        # Mock the response object returned by page.goto
-        mock_response = MagicMock()
-        mock_response.status = 200
 
-        # Mock _goto_with_retry specifically for this test
-        mock_goto = mocker.patch('app.mcp.crawler_server._goto_with_retry', return_value=mock_response, new_callable=AsyncMock)
+    @pytest.mark.parametrize("test_url, status, title, expected", [
+        ("http://example.com", 200, "Example Domain",
+         {"status": "success", "page_title": "Example Domain", "status_code": 200}),
+        ("http://example.com/nonexistent", 404, "Not Found",
+         {"status": "error", "message": "Failed to navigate to http://example.com/nonexistent", "status_code": 404}),
+    ], ids=["success", "not_found"])
+    async def test_crawl_page_tool(self, mock_page, test_url, status, title, expected):
+        """Test crawl_page tool success and 404 error scenarios with mocks."""
+        mock_page.title.return_value = title
+        self.mock_goto.return_value.status = status
 
-        # Mock the browser pool manager to return a mock browser
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        # Patch the correct method on the browser_pool instance
-        mocker.patch.object(browser_pool, 'get_managed_browser', return_value=self._async_context_manager_mock(mock_browser))
-
-        test_url = "http://example.com"
         # Call the tool directly
         result_data = await crawler_mcp_app.call_tool("crawl_page", {"url": test_url})
-        print(f"DEBUG crawl_success: {result_data}")
+        print(f"DEBUG crawl_page[{status}]: {result_data}")
 
         # Parse the result
-        assert isinstance(result_data, list) and len(result_data) > 0
-        if hasattr(result_data[0], 'text'):
-            tool_output = json.loads(result_data[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "success"
-        assert tool_output["page_title"] == "Example Domain"
-        mock_goto.assert_awaited_once()
-        mock_page.close.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_crawl_page_tool_not_found(self, mocker):
-        """Test crawl_page tool 404 error scenario with mocks."""
-        mock_page = AsyncMock()
-        mock_page.title = AsyncMock(return_value="Not Found") # Title might vary
-        mock_page.close = AsyncMock()
-
-        mock_response = MagicMock()
-        mock_response.status = 404
-
-        mock_goto = mocker.patch('app.mcp.crawler_server._goto_with_retry', return_value=mock_response, new_callable=AsyncMock)
+        tool_output = parse_tool_output(result_data)
 
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        # Patch the correct method on the browser_pool instance
-        mocker.patch.object(browser_pool, 'get_managed_browser', return_value=self._async_context_manager_mock(mock_browser))
-
-        test_url = "http://example.com/nonexistent"
-        # Call the tool directly
-        result_data = await crawler_mcp_app.call_tool("crawl_page", {"url": test_url})
-        print(f"DEBUG crawl_not_found: {result_data}")
-        
-        # Parse the result
-        assert isinstance(result_data, list) and len(result_data) > 0
-        if hasattr(result_data[0], 'text'):
-            tool_output = json.loads(result_data[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "error"
-        assert "Failed to navigate" in tool_output["message"]
-        assert tool_output["status_code"] == 404
-        mock_goto.assert_awaited_once()
+        assert tool_output.model_dump(include=set(expected)) == expected
+        self.mock_goto.assert_awaited_once()
         mock_page.close.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_extract_content_tool_success(self, mocker):
+    async def test_extract_content_tool_success(self, mocker, mock_page):
         """Test extract_content tool success scenario with mocks."""
         test_url = "http://example.com"
         selectors = ["h1", "p"]
-        mock_page = AsyncMock()
-        mock_page.close = AsyncMock()
 
-        # Mock responses for goto and extract
-        mock_response_goto = MagicMock(); mock_response_goto.status = 200
+        # Mock responses for extract (goto는 _patch_goto fixture가 200 응답)
         mock_extract_h1 = ["Example Domain"]
         mock_extract_p = ["This domain is for use in illustrative examples in documents."]
 
-        mocker.patch('app.mcp.crawler_server._goto_with_retry', return_value=mock_response_goto, new_callable=AsyncMock)
         async def mock_extract_side_effect(page, selector):
             if selector == "h1": return mock_extract_h1
             if selector == "p": return mock_extract_p
             return []
         mock_extract = mocker.patch('app.mcp.crawler_server._extract_selector_with_retry', side_effect=mock_extract_side_effect, new_callable=AsyncMock)
 
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        # Patch the correct method on the browser_pool instance
-        mocker.patch.object(browser_pool, 'get_managed_browser', return_value=self._async_context_manager_mock(mock_browser))
-
         # Call the tool directly
         result_data = await crawler_mcp_app.call_tool("extract_content", {"url": test_url, "selectors": selectors})
         print(f"DEBUG extract_success: {result_data}")
 
         # Parse the result
-        assert isinstance(result_data, list) and len(result_data) > 0
-        if hasattr(result_data[0], 'text'):
-            tool_output = json.loads(result_data[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "success"
-        assert tool_output["extracted_content"]["h1"] == mock_extract_h1
-        assert tool_output["extracted_content"]["p"] == mock_extract_p
+        tool_output = parse_tool_output(result_data)
+
+        assert tool_output.status == "success"
+        assert tool_output.extracted_content["h1"] == mock_extract_h1
+        assert tool_output.extracted_content["p"] == mock_extract_p
         assert mock_extract.await_count == len(selectors)
         mock_page.close.assert_awaited()
 
-    @pytest.mark.asyncio
-    async def test_extract_content_tool_partial_fail(self, mocker):
+    async def test_extract_content_tool_partial_fail(self, mocker, mock_page):
         """Test extract_content with one selector failing."""
         test_url = "http://example.com"
         selectors = ["h1", "#nonexistent"]
-        mock_page = AsyncMock()
-        mock_page.close = AsyncMock()
 
-        mock_response_goto = MagicMock(); mock_response_goto.status = 200
         mock_extract_h1 = ["Example Domain"]
 
-        mocker.patch('app.mcp.crawler_server._goto_with_retry', return_value=mock_response_goto, new_callable=AsyncMock)
         async def mock_extract_side_effect(page, selector):
             if selector == "h1": return mock_extract_h1
             if selector == "#nonexistent": return None
             return []
         mock_extract = mocker.patch('app.mcp.crawler_server._extract_selector_with_retry', side_effect=mock_extract_side_effect, new_callable=AsyncMock)
 
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        # Patch the correct method on the browser_pool instance
-        mocker.patch.object(browser_pool, 'get_managed_browser', return_value=self._async_context_manager_mock(mock_browser))
-
         # Call the tool directly
         result_data = await crawler_mcp_app.call_tool("extract_content", {"url": test_url, "selectors": selectors})
         print(f"DEBUG extract_partial: {result_data}")
 
         # Parse the result
-        assert isinstance(result_data, list) and len(result_data) > 0
-        if hasattr(result_data[0], 'text'):
-            tool_output = json.loads(result_data[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "success"
-        assert tool_output["extracted_content"]["h1"] == mock_extract_h1
-        assert tool_output["extracted_content"]["#nonexistent"] is None
+        tool_output = parse_tool_output(result_data)
+
+        assert tool_output.status == "success"
+        assert tool_output.extracted_content["h1"] == mock_extract_h1
+        assert tool_output.extracted_content["#nonexistent"] is None
         assert mock_extract.await_count == len(selectors)
         mock_page.close.assert_awaited()
 
-    @pytest.mark.asyncio
-    async def test_extract_content_tool_page_fail(self, mocker):
+    async def test_extract_content_tool_page_fail(self, mocker, mock_page):
         """Test extract_content when page navigation fails."""
         test_url = "http://example.com/404"
         selectors = ["h1"]
 
         # Mock goto to return non-200 status which should raise error in context
-        mock_response_goto = MagicMock(); mock_response_goto.status = 404
-        mocker.patch('app.mcp.crawler_server._goto_with_retry', return_value=mock_response_goto, new_callable=AsyncMock)
+        self.mock_goto.return_value.status = 404
         mock_extract = mocker.patch('app.mcp.crawler_server._extract_selector_with_retry')
 
-        mock_page = AsyncMock()
-        mock_page.close = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        # Patch the correct method on the browser_pool instance
-        mocker.patch.object(browser_pool, 'get_managed_browser', return_value=self._async_context_manager_mock(mock_browser))
-
         # Call the tool directly
         result_data = await crawler_mcp_app.call_tool("extract_content", {"url": test_url, "selectors": selectors})
         print(f"DEBUG extract_page_fail: {result_data}")
 
         # Parse the result
-        assert isinstance(result_data, list) and len(result_data) > 0
-        if hasattr(result_data[0], 'text'):
-            tool_output = json.loads(result_data[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {result_data}")
-
-        assert tool_output["status"] == "error"
-        assert f"Failed to navigate to {test_url}" in tool_output["message"] # Error should originate from navigation failure
-        assert "status_code" in tool_output and tool_output["status_code"] == 404
+        tool_output = parse_tool_output(result_data)
+
+        assert tool_output.status == "error"
+        assert f"Failed to navigate to {test_url}" in tool_output.message # Error should originate from navigation failure
+        assert tool_output.status_code == 404
         mock_extract.assert_not_awaited()
         mock_page.close.assert_awaited()
 
-    @pytest.mark.asyncio
-    async def test_placeholder_tools(self, mocker):
+    @pytest.mark.parametrize("tool, args", [
+        ("interact_with_page", {"url": "http://example.com", "actions": [{"action": "click", "selector": "#id"}]}),
+        ("follow_links", {"url": "http://example.com", "pattern": ".*"}),
+    ])
+    async def test_placeholder_tools(self, tool, args):
         """Test that placeholder tools return a pending/not implemented status using call_tool."""
-        # Test interact_with_page
-        interact_result_list = await crawler_mcp_app.call_tool("interact_with_page", {
-            "url": "http://example.com",
-            "actions": [{"action": "click", "selector": "#id"}]
-        })
-        # Parse result
-        assert isinstance(interact_result_list, list) and len(interact_result_list) > 0
-        if hasattr(interact_result_list[0], 'text'):
-            interact_output = json.loads(interact_result_list[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {interact_result_list}")
-            
-        assert interact_output["status"] in ["pending", "not_implemented"]
-        assert "not implemented" in interact_output["message"]
-
-        # Test follow_links
-        follow_result_list = await crawler_mcp_app.call_tool("follow_links", {
-            "url": "http://example.com",
-            "pattern": ".*"
-        })
+        result_list = await crawler_mcp_app.call_tool(tool, args)
         # Parse result
-        assert isinstance(follow_result_list, list) and len(follow_result_list) > 0
-        if hasattr(follow_result_list[0], 'text'):
-            follow_output = json.loads(follow_result_list[0].text)
-        else:
-            raise TypeError(f"Unexpected result structure: {follow_result_list}")
-            
-        assert follow_output["status"] in ["pending", "not_implemented"]
-        assert "not implemented" in follow_output["message"]
-
-    # Helper to create an async context manager mock
-    def _async_context_manager_mock(self, return_value):
-        cm = MagicMock()
-        cm.__aenter__.return_value = return_value
-        cm.__aexit__.return_value = None
-        return cm
+        tool_output = parse_tool_output(result_list)
+
+        assert tool_output.status in ["pending", "not_implemented"]
+        assert "not implemented" in tool_output.message
+
+    async def test_tools_concurrent(self, fake_pool, mock_page):
+        """Run every tool concurrently on one event loop with asyncio.gather (mocked scenario)."""
+        mock_page.title.return_value = "Example Domain"
+        crawl_urls = [f"http://example.com/{i}" for i in range(3)]
+        cases = [
+            ("launch_browser", {}, {"status": "success"}),
+            *[("crawl_page", {"url": url}, {"status": "success", "page_title": "Example Domain"}) for url in crawl_urls],
+            ("interact_with_page", {"url": "http://example.com", "actions": []}, {"status": "pending"}),
+            ("follow_links", {"url": "http://example.com", "pattern": ".*"}, {"status": "pending"}),
+        ]
+
+        results = await asyncio.gather(*(crawler_mcp_app.call_tool(name, args) for name, args, _ in cases))
+
+        for (name, _, expected), result_data in zip(cases, results):
+            tool_output = parse_tool_output(result_data)
+            assert tool_output.model_dump(include=set(expected)) == expected, name
+        # crawl_page 호출마다 페이지를 하나씩 열고 닫음
+        assert self.mock_goto.await_count == len(crawl_urls)
+        assert mock_page.close.await_count == len(crawl_urls)
 
     # TODO: Add test for extract_content with selector error
-    # TODO: Add concurrency tests (mocked scenario)
@@ -1,146 +1,118 @@
-import unittest
 import pytest
-import requests
-import os
-import sys
-import threading
-import time
-from fastapi.testclient import TestClient
 
-# 프로젝트 루트 디렉토리를 sys.path에 추가
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from app.main import app as fastapi_app, start_mcp_in_thread
 from app.mcp.server import app as mcp_app
 
 
-class TestRSSMCPServer(unittest.TestCase):
+@pytest.fixture(scope="module", autouse=True)
+async def initial_feed_collection(client):
+    """TC-MCP-004: 테스트 시작 전 초기 피드 수집 실행 (파일 생성 목적)
+
+    client는 tests/conftest.py의 세션 공유 ASGI 테스트 클라이언트이며, 요청은 테스트와 같은 이벤트 루프에서
+    앱으로 직접 전달되므로 별도 서버 스레드나 대기 시간이 필요 없습니다.
+    """
+    try:
+        await client.post("/api/feeds/collect?refresh=true") # refresh=true로 항상 새 파일 생성
+        print("Initial feed collection executed.")
+    except Exception as e:
+        print(f"Error during initial feed collection: {e}")
+
+
+class TestRSSMCPServer:
     """RSS-MCP 서버 테스트 클래스"""
 
-    @classmethod
-    def setUpClass(cls):
-        """TC-MCP-004: 테스트 클래스 설정 - 서버 시작 및 초기 피드 수집"""
-        cls.client = TestClient(fastapi_app) 
-        # MCP 서버 시작 (스레드)
-        threading.Thread(target=start_mcp_in_thread, daemon=True).start()
-        time.sleep(2) # MCP 서버 시작 대기
-        
-        # 테스트 시작 전 초기 피드 수집 실행 (파일 생성 목적)
-        try:
-             cls.client.post("/api/feeds/collect?refresh=true") # refresh=true로 항상 새 파일 생성
-             time.sleep(1) # 수집 및 파일 저장 시간 대기 (필요에 따라 조정)
-             print("Initial feed collection executed.")
-        except Exception as e:
-             print(f"Error during initial feed collection: {e}")
-
-    def test_fastapi_server(self):
+    async def test_fastapi_server(self, client):
         """TC-MCP-001: FastAPI 서버 루트 응답 테스트"""
         # 루트 경로 테스트
-        response = self.client.get("/")
-        self.assertEqual(response.status_code, 200)
+        response = await client.get("/")
+        assert response.status_code == 200
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self, client):
         """TC-MCP-002: Health Check 엔드포인트 테스트"""
-        response = self.client.get("/health")
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(), {"status": "healthy"})
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
 
-    def test_api_status(self):
+    async def test_api_status(self, client):
         """TC-MCP-003: API 상태 엔드포인트 테스트"""
-        response = self.client.get("/api/status")
-        self.assertEqual(response.status_code, 200)
+        response = await client.get("/api/status")
+        assert response.status_code == 200
         data = response.json()
-        self.assertIn("status", data)
-        self.assertIn("version", data)
-
-    def test_feeds_categories(self):
-        """TC-MCP-010: 피드 카테고리 리소스 엔드포인트 테스트"""
-        response = self.client.get("/api/feeds/categories")
-        self.assertEqual(response.status_code, 200)
-        categories = response.json()
-        self.assertIsInstance(categories, list)
-        # 최소한 일부 카테고리가 있는지 확인
-        self.assertGreater(len(categories), 0)
-
-    def test_feeds_sources(self):
-        """TC-MCP-011: 피드 소스 리소스 엔드포인트 테스트"""
-        response = self.client.get("/api/feeds/sources")
-        self.assertEqual(response.status_code, 200)
-        sources = response.json()
-        self.assertIsInstance(sources, list)
-        # 최소한 일부 소스가 있는지 확인
-        self.assertGreater(len(sources), 0)
-
-    def test_collect_feeds(self):
+        assert "status" in data
+        assert "version" in data
+
+    @pytest.mark.parametrize("path", [
+        "/api/feeds/categories", # TC-MCP-010: 피드 카테고리 리소스
+        "/api/feeds/sources", # TC-MCP-011: 피드 소스 리소스
+    ], ids=["categories", "sources"])
+    async def test_feeds_resources(self, client, path):
+        """TC-MCP-010, TC-MCP-011: 피드 카테고리/소스 리소스 엔드포인트 테스트"""
+        response = await client.get(path)
+        assert response.status_code == 200
+        items = response.json()
+        assert isinstance(items, list)
+        # 최소한 일부 항목이 있는지 확인
+        assert len(items) > 0
+
+    async def test_collect_feeds(self, client):
         """TC-MCP-006: 피드 수집 도구 엔드포인트 테스트"""
-        response = self.client.post("/api/feeds/collect")
-        self.assertEqual(response.status_code, 200)
+        response = await client.post("/api/feeds/collect")
+        assert response.status_code == 200
         result = response.json()
-        self.assertIn("message", result)
-        self.assertIn("count", result)
+        assert "message" in result
+        assert "count" in result
 
-    def test_latest_feeds(self):
+    async def test_latest_feeds(self, client):
         """TC-MCP-007: 최신 피드 조회 도구 엔드포인트 테스트"""
-        # 먼저 피드 수집 확인
-        self.client.post("/api/feeds/collect")
-        
+        # 피드 파일은 initial_feed_collection fixture에서 모듈당 한 번 생성됨
         # 최신 피드 요청
-        response = self.client.get("/api/feeds/latest")
-        self.assertEqual(response.status_code, 200)
+        response = await client.get("/api/feeds/latest")
+        assert response.status_code == 200
         feeds = response.json()
-        self.assertIsInstance(feeds, list)
-        
+        assert isinstance(feeds, list)
+
         # 피드가 수집되었는지 확인
         if len(feeds) > 0:
             # 피드 구조 확인
             feed = feeds[0]
-            self.assertIn("id", feed)
-            self.assertIn("title", feed)
-            self.assertIn("link", feed)
-            self.assertIn("published", feed)
+            assert "id" in feed
+            assert "title" in feed
+            assert "link" in feed
+            assert "published" in feed
 
-    def test_search_feeds(self):
+    async def test_search_feeds(self, client):
         """TC-MCP-008: 피드 검색 도구 엔드포인트 테스트"""
-        # 먼저 피드 수집 확인
-        self.client.post("/api/feeds/collect")
-        
+        # 피드 파일은 initial_feed_collection fixture에서 모듈당 한 번 생성됨
         # 'AI'로 검색 요청 (쿼리 파라미터 이름 'q' -> 'query'로 수정)
-        response = self.client.get("/api/feeds/search?query=AI")
-        self.assertEqual(response.status_code, 200)
+        response = await client.get("/api/feeds/search?query=AI")
+        assert response.status_code == 200
         results = response.json()
-        self.assertIsInstance(results, list)
-        
+        assert isinstance(results, list)
+
         # 검색 결과 구조 확인
         if len(results) > 0:
             result = results[0]
-            self.assertIn("id", result)
-            self.assertIn("title", result)
-            self.assertIn("link", result)
+            assert "id" in result
+            assert "title" in result
+            assert "link" in result
 
     def test_mcp_server_tools(self):
         """TC-MCP-005, TC-MCP-012: MCP 도구 등록 확인 (RSS, 요약, 음성)"""
-        self.assertIsNotNone(mcp_app)
+        assert mcp_app is not None
         # len() 호출 대신 객체 존재 여부만 확인 (임시 조치)
-        # tools = mcp_app.tool 
+        # tools = mcp_app.tool
         # self.assertGreater(len(tools), 0)
         # tool_names = list(tools.keys())
-        
+
         # TODO: mcp v1.6.0 에서 도구 목록 확인 방법 재확인 필요
         # 임시로 도구 등록 여부는 직접 확인하지 않음
-        pass 
 
     def test_mcp_server_resources(self):
         """TC-MCP-009: MCP 리소스 등록 확인"""
-        self.assertIsNotNone(mcp_app)
+        assert mcp_app is not None
         # len() 호출 대신 객체 존재 여부만 확인 (임시 조치)
-        # resources = mcp_app.resource 
+        # resources = mcp_app.resource
         # self.assertGreater(len(resources), 0)
         # resource_names = list(resources.keys())
 
         # TODO: mcp v1.6.0 에서 리소스 목록 확인 방법 재확인 필요
         # 임시로 리소스 등록 여부는 직접 확인하지 않음
-        pass
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
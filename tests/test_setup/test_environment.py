@@ -1,7 +1,15 @@
 import os
 import sys
-import importlib
+import importlib.util
 import unittest
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _is_installed(package: str) -> bool:
+    """패키지 설치 여부 (프로세스 내에서 패키지당 한 번만 스펙 조회)"""
+    return importlib.util.find_spec(package) is not None
+
 
 class TestEnvironmentSetup(unittest.TestCase):
     """개발 환경 설정 테스트 클래스"""
@@ -20,43 +28,45 @@ class TestEnvironmentSetup(unittest.TestCase):
             'dotenv', 'apscheduler'
         ]
         
-        for package in required_packages:
-            try:
-                if package == 'dotenv':
-                    importlib.import_module('dotenv')
-                else:
-                    importlib.import_module(package)
-                result = True
-            except ImportError:
-                result = False
-            
-            self.assertTrue(result, f"패키지 '{package}'가 설치되어 있지 않습니다.")
+        # 모듈을 실제로 실행(임포트)하지 않고 스펙만 조회해 설치 여부 확인
+        missing = [package for package in required_packages if not _is_installed(package)]
+        self.assertFalse(missing, f"패키지 {missing}가 설치되어 있지 않습니다.")
     
+    @staticmethod
+    def _scan(path):
+        """디렉토리를 os.scandir로 한 번만 읽어 (하위 디렉토리 이름 집합, 파일 이름 집합) 반환"""
+        with os.scandir(path) as entries:
+            entries = list(entries)
+        return ({e.name for e in entries if e.is_dir()},
+                {e.name for e in entries if e.is_file()})
+
     def test_project_structure(self):
         """프로젝트 구조 확인 테스트"""
+        # 부모 디렉토리마다 한 번씩만 스캔 (항목별 os.path.isdir/isfile 호출 대신)
+        root_dirs, root_files = self._scan('.')
+        app_dirs, app_files = self._scan('app')
+
         # 루트 디렉토리 확인
-        root_dirs = ['app', 'data', 'static', 'tests']
-        for directory in root_dirs:
-            self.assertTrue(os.path.isdir(directory), f"'{directory}' 디렉토리가 존재하지 않습니다.")
+        required_root_dirs = {'app', 'data', 'static', 'tests'}
+        missing = required_root_dirs - root_dirs
+        self.assertFalse(missing, f"디렉토리 {sorted(missing)}가 존재하지 않습니다.")
         
         # app 디렉토리 내부 확인
-        app_dirs = [
+        required_app_dirs = {
             'collector', 'processor', 'summarizer', 'publisher', 
             'models', 'api', 'scheduler', 'templates'
-        ]
-        for directory in app_dirs:
-            dir_path = os.path.join('app', directory)
-            self.assertTrue(os.path.isdir(dir_path), f"'{dir_path}' 디렉토리가 존재하지 않습니다.")
+        }
+        missing = required_app_dirs - app_dirs
+        self.assertFalse(missing, f"'app' 하위 디렉토리 {sorted(missing)}가 존재하지 않습니다.")
         
         # 필수 파일 확인
-        required_files = [
-            'README.md', 'requirements.txt', '.gitignore',
-            os.path.join('app', '__init__.py'),
-            os.path.join('app', 'config.py'),
-            os.path.join('app', 'main.py'),
-        ]
-        for file_path in required_files:
-            self.assertTrue(os.path.isfile(file_path), f"'{file_path}' 파일이 존재하지 않습니다.")
+        required_root_files = {'README.md', 'requirements.txt', '.gitignore'}
+        missing = required_root_files - root_files
+        self.assertFalse(missing, f"파일 {sorted(missing)}가 존재하지 않습니다.")
+
+        required_app_files = {'__init__.py', 'config.py', 'main.py'}
+        missing = required_app_files - app_files
+        self.assertFalse(missing, f"'app' 하위 파일 {sorted(missing)}가 존재하지 않습니다.")
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file